@@ -23,6 +23,7 @@ Usage:
         --timeout 30            # Worker timeout in minutes
         --headless              # Run browsers in headless mode
         --skip-generation       # Skip resume/cover letter generation
+        --in-process            # Run jobs as coroutines in this process (no subprocesses)
 
 Architecture:
     Supervisor Process (this file)
@@ -326,6 +327,18 @@ class ProcessPoolSupervisor:
         running: List[WorkerProcess] = []
         results: List[Dict[str, Any]] = []
         
+        # Opt-in: run jobs concurrently inside this process instead of subprocesses
+        in_process_concurrency = config.get('in_process_concurrency', 0)
+        if in_process_concurrency:
+            from job_worker import run_batch as run_batch_in_process
+            
+            self._log_and_flush('info', f'🧵 In-process mode: {in_process_concurrency} concurrent jobs')
+            pending.clear()
+            results = await run_batch_in_process(
+                jobs, config, concurrency=in_process_concurrency,
+                should_stop=lambda: self.shutdown_requested
+            )
+        
         # Main supervision loop
         while (pending or running) and not self.shutdown_requested:
             # Start new workers up to max_concurrent
@@ -757,6 +770,12 @@ Examples:
         help='Worker timeout in minutes (default: 30)'
     )
     
+    parser.add_argument(
+        '--in-process',
+        action='store_true',
+        help='Run jobs as concurrent coroutines in this process instead of one subprocess per job'
+    )
+    
     args = parser.parse_args()
     
     # Load jobs
@@ -778,7 +797,8 @@ Examples:
     config = {
         'skip_generation': args.skip_generation,
         'headless': args.headless,
-        'timeout_minutes': args.timeout
+        'timeout_minutes': args.timeout,
+        'in_process_concurrency': max_concurrent if args.in_process else 0
     }
     
     # Create supervisor
@@ -18,9 +18,16 @@ Date: February 12, 2026
 
 import logging
 import re
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Tuple, Optional, Dict
 from enum import Enum
 
+try:
+    import hyperscan  # python-hyperscan (optional, x86-64 only)
+except ImportError:
+    hyperscan = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,6 +46,132 @@ class BlockerType(Enum):
     UNKNOWN = "unknown"
 
 
+# Characters that re.IGNORECASE matches to an ASCII letter but str.lower()
+# leaves alone; folded so case-sensitive matching on lowercased text agrees
+_IGNORECASE_EXTRA_FOLDS = {'ı': 'i', 'ſ': 's'}
+_IGNORECASE_EXTRA_TABLE = str.maketrans(_IGNORECASE_EXTRA_FOLDS)
+
+
+@lru_cache(maxsize=1)
+def _lowercase_page(page_text: str) -> str:
+    """
+    Lowercase page text once for all detectors.
+    
+    BlockerHandler runs every detector over the same page in a row, so
+    remembering the last page means it is lowercased once per check
+    instead of once per detector.
+    """
+    page_lower = page_text.lower()
+    if any(char in page_lower for char in _IGNORECASE_EXTRA_FOLDS):
+        page_lower = page_lower.translate(_IGNORECASE_EXTRA_TABLE)
+    return page_lower
+
+
+def _required_literals(pattern: str) -> Tuple[str, ...]:
+    """
+    Plain words every match of `pattern` must contain, longest first.
+    
+    Blocker patterns are simple concatenations ("verification\\s+code.*email"),
+    so each literal word in them is required. Patterns using alternation,
+    optional parts, groups or a starred letter get no literals and are
+    always searched.
+    """
+    if re.search(r'[|?()\[\]{}]|[a-z0-9]\*', pattern):
+        return ()
+    words = re.findall(r'[a-z0-9]+', re.sub(r'\\.', ' ', pattern))
+    return tuple(sorted(set(words), key=len, reverse=True))
+
+
+@lru_cache(maxsize=None)
+def _compile_patterns(patterns: Tuple[str, ...]) -> Tuple[Tuple[Tuple[str, ...], Optional[re.Pattern]], ...]:
+    """
+    Compile a pattern list once (keyed on its contents, so edits are picked up).
+    
+    Patterns are lowercase and only ever run on _lowercase_page() output,
+    so they are compiled case-sensitively: re.IGNORECASE on already
+    lowercased text costs ~7x per search for no difference in matches.
+    Each pattern is paired with its required literals for prefiltering;
+    pure literals ("captcha", "hirevue") get no regex at all, since the
+    substring test alone decides them.
+    """
+    compiled = []
+    for pattern in patterns:
+        if re.fullmatch(r'[a-z0-9 ]+', pattern):
+            compiled.append(((pattern,), None))
+        else:
+            compiled.append((_required_literals(pattern), re.compile(pattern)))
+    return tuple(compiled)
+
+
+# Python's \s matches these separators, Hyperscan's Unicode \s does not
+_HYPERSCAN_UNSAFE_CHARS = ('\x1c', '\x1d', '\x1e', '\x1f')
+
+
+@lru_cache(maxsize=None)
+def _hyperscan_database(patterns: Tuple[str, ...]):
+    """
+    Compile a pattern list into one Hyperscan database (None if unsupported).
+    
+    UTF8 + UCP give '.', \\s and \\d the same code-point semantics as re;
+    without DOTALL, '.' stops at newlines just like re.
+    """
+    flags = hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[pattern.encode('utf-8') for pattern in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[flags] * len(patterns),
+        )
+    except Exception as e:  # hyperscan.error: pattern outside Hyperscan's syntax
+        logger.debug(f"Hyperscan cannot compile blocker patterns, using re: {e}")
+        return None
+    return database
+
+
+@lru_cache(maxsize=1)
+def _page_bytes(page_lower: str) -> Optional[bytes]:
+    """UTF-8 bytes of the lowercased page for Hyperscan (None: use re instead)."""
+    if any(char in page_lower for char in _HYPERSCAN_UNSAFE_CHARS):
+        return None
+    try:
+        return page_lower.encode('utf-8')
+    except UnicodeEncodeError:  # Lone surrogates are not valid UTF-8
+        return None
+
+
+def _hyperscan_on_match(match_id, start, end, flags, context):
+    context.append(match_id)
+    return True  # Halt the scan: one hit is enough
+
+
+def _matches_any(patterns, page_lower: str) -> bool:
+    """True if any of the regex patterns matches the lowercased page text."""
+    patterns = tuple(patterns)
+    
+    # One multi-pattern pass when Hyperscan is installed
+    if hyperscan is not None:
+        database = _hyperscan_database(patterns)
+        data = _page_bytes(page_lower) if database is not None else None
+        if data is not None:
+            hits = []
+            try:
+                database.scan(data, match_event_handler=_hyperscan_on_match, context=hits)
+            except getattr(hyperscan, 'ScanTerminated', ()):
+                pass
+            return bool(hits)
+    
+    # Plain substring tests reject most patterns before the regex runs
+    for literals, compiled in _compile_patterns(patterns):
+        if literals and literals[0] not in page_lower:
+            continue  # Longest word first: most patterns stop here
+        if all(literal in page_lower for literal in literals[1:]):
+            if compiled is None or compiled.search(page_lower):
+                return True
+    return False
+
+
 class BlockerDetector:
     """
     Detects various types of blockers on job application pages.
@@ -142,13 +275,12 @@ class BlockerDetector:
         Returns:
             (is_blocked, reason)
         """
-        page_lower = page_text.lower()
+        page_lower = _lowercase_page(page_text)
         
-        for pattern in cls.EMAIL_VERIFICATION_PATTERNS:
-            if re.search(pattern, page_lower, re.IGNORECASE):
-                reason = "Email verification code required - cannot access email inbox"
-                logger.warning(f"🚫 BLOCKER: {reason}")
-                return True, reason
+        if _matches_any(cls.EMAIL_VERIFICATION_PATTERNS, page_lower):
+            reason = "Email verification code required - cannot access email inbox"
+            logger.warning(f"🚫 BLOCKER: {reason}")
+            return True, reason
         
         return False, ""
     
@@ -160,13 +292,12 @@ class BlockerDetector:
         Returns:
             (is_blocked, reason)
         """
-        page_lower = page_text.lower()
+        page_lower = _lowercase_page(page_text)
         
-        for pattern in cls.CAPTCHA_PATTERNS:
-            if re.search(pattern, page_lower, re.IGNORECASE):
-                reason = "CAPTCHA detected - requires human verification"
-                logger.warning(f"🚫 BLOCKER: {reason}")
-                return True, reason
+        if _matches_any(cls.CAPTCHA_PATTERNS, page_lower):
+            reason = "CAPTCHA detected - requires human verification"
+            logger.warning(f"🚫 BLOCKER: {reason}")
+            return True, reason
         
         return False, ""
     
@@ -178,13 +309,12 @@ class BlockerDetector:
         Returns:
             (is_blocked, reason)
         """
-        page_lower = page_text.lower()
+        page_lower = _lowercase_page(page_text)
         
-        for pattern in cls.EXPIRED_JOB_PATTERNS:
-            if re.search(pattern, page_lower, re.IGNORECASE):
-                reason = "Job posting expired or removed - impossible to apply"
-                logger.warning(f"🚫 BLOCKER: {reason}")
-                return True, reason
+        if _matches_any(cls.EXPIRED_JOB_PATTERNS, page_lower):
+            reason = "Job posting expired or removed - impossible to apply"
+            logger.warning(f"🚫 BLOCKER: {reason}")
+            return True, reason
         
         return False, ""
     
@@ -196,13 +326,12 @@ class BlockerDetector:
         Returns:
             (is_blocked, reason)
         """
-        page_lower = page_text.lower()
+        page_lower = _lowercase_page(page_text)
         
-        for pattern in cls.PHONE_VERIFICATION_PATTERNS:
-            if re.search(pattern, page_lower, re.IGNORECASE):
-                reason = "Phone verification code required - cannot access SMS"
-                logger.warning(f"🚫 BLOCKER: {reason}")
-                return True, reason
+        if _matches_any(cls.PHONE_VERIFICATION_PATTERNS, page_lower):
+            reason = "Phone verification code required - cannot access SMS"
+            logger.warning(f"🚫 BLOCKER: {reason}")
+            return True, reason
         
         return False, ""    
     @classmethod
@@ -213,13 +342,12 @@ class BlockerDetector:
         Returns:
             (is_blocked, reason)
         """
-        page_lower = page_text.lower()
+        page_lower = _lowercase_page(page_text)
         
-        for pattern in cls.ACCOUNT_LOCKED_PATTERNS:
-            if re.search(pattern, page_lower, re.IGNORECASE):
-                reason = "Account locked or authentication failed - cannot proceed with automated login"
-                logger.warning(f"🚫 BLOCKER: {reason}")
-                return True, reason
+        if _matches_any(cls.ACCOUNT_LOCKED_PATTERNS, page_lower):
+            reason = "Account locked or authentication failed - cannot proceed with automated login"
+            logger.warning(f"🚫 BLOCKER: {reason}")
+            return True, reason
         
         return False, ""    
     @classmethod
@@ -230,13 +358,12 @@ class BlockerDetector:
         Returns:
             (is_blocked, reason)
         """
-        page_lower = page_text.lower()
+        page_lower = _lowercase_page(page_text)
         
-        for pattern in cls.VIDEO_PATTERNS:
-            if re.search(pattern, page_lower, re.IGNORECASE):
-                reason = "Video interview required - cannot automate video recording"
-                logger.warning(f"⚠️  BLOCKER: {reason}")
-                return True, reason
+        if _matches_any(cls.VIDEO_PATTERNS, page_lower):
+            reason = "Video interview required - cannot automate video recording"
+            logger.warning(f"⚠️  BLOCKER: {reason}")
+            return True, reason
         
         return False, ""
     
@@ -248,13 +375,12 @@ class BlockerDetector:
         Returns:
             (is_blocked, reason)
         """
-        page_lower = page_text.lower()
+        page_lower = _lowercase_page(page_text)
         
-        for pattern in cls.ASSESSMENT_PATTERNS:
-            if re.search(pattern, page_lower, re.IGNORECASE):
-                reason = "Online assessment/test required - cannot automate"
-                logger.warning(f"⚠️  BLOCKER: {reason}")
-                return True, reason
+        if _matches_any(cls.ASSESSMENT_PATTERNS, page_lower):
+            reason = "Online assessment/test required - cannot automate"
+            logger.warning(f"⚠️  BLOCKER: {reason}")
+            return True, reason
         
         return False, ""
 
@@ -264,6 +390,15 @@ class BlockerHandler:
     Main handler for detecting and classifying blockers.
     """
     
+    # Blockers that make the application impossible to automate
+    HARD_BLOCKERS = frozenset({
+        BlockerType.EMAIL_VERIFICATION,
+        BlockerType.CAPTCHA,
+        BlockerType.EXPIRED_JOB,
+        BlockerType.PHONE_VERIFICATION,
+        BlockerType.ACCOUNT_LOCKED,
+    })
+    
     def __init__(self):
         self.detector = BlockerDetector()
         
@@ -314,15 +449,7 @@ class BlockerHandler:
         Returns:
             True if should mark as impossible_task=True
         """
-        hard_blockers = [
-            BlockerType.EMAIL_VERIFICATION,
-            BlockerType.CAPTCHA,
-            BlockerType.EXPIRED_JOB,
-            BlockerType.PHONE_VERIFICATION,
-            BlockerType.ACCOUNT_LOCKED,
-        ]
-        
-        return blocker_type in hard_blockers
+        return blocker_type in self.HARD_BLOCKERS
     
     def get_termination_message(self, blocker_type: BlockerType, reason: str) -> str:
         """
@@ -375,6 +502,17 @@ class BlockerHandler:
         logger.info(f"📊 Blocker Category: {category}")
 
 
+# Shared handler for check_for_blockers (the handler keeps no per-call state)
+_DEFAULT_HANDLER = BlockerHandler()
+
+# Recent check_for_blockers results, keyed on (hash, length, url) of the page
+# rather than the page itself so the 512 entries don't keep 512 pages alive.
+# (The maxsize=1 helpers above, such as _lowercase_page, still hold the most
+# recently checked page and its lowercased copy until the next check.)
+BLOCKER_CACHE_SIZE = 512
+_blocker_cache: "OrderedDict[Tuple[int, int, str], Tuple[bool, BlockerType, str]]" = OrderedDict()
+
+
 # Convenience function for quick integration
 def check_for_blockers(page_text: str, url: str) -> Tuple[bool, BlockerType, str, bool]:
     """
@@ -397,8 +535,21 @@ def check_for_blockers(page_text: str, url: str) -> Tuple[bool, BlockerType, str
                 # Try to proceed but warn
                 logger.warning(f"Soft blocker detected: {reason}")
     """
-    handler = BlockerHandler()
-    is_blocked, blocker_type, reason = handler.check_for_blockers(page_text, url)
+    handler = _DEFAULT_HANDLER
+    cache_key = (hash(page_text), len(page_text), url)
+    cached = _blocker_cache.get(cache_key)
+    
+    if cached is None:
+        is_blocked, blocker_type, reason = handler.check_for_blockers(page_text, url)
+        _blocker_cache[cache_key] = (is_blocked, blocker_type, reason)
+        if len(_blocker_cache) > BLOCKER_CACHE_SIZE:
+            _blocker_cache.popitem(last=False)
+    else:
+        _blocker_cache.move_to_end(cache_key)
+        is_blocked, blocker_type, reason = cached
+        if is_blocked:
+            # Re-run just the detector that fired so its warning is still logged
+            dict(handler.detection_chain)[blocker_type](page_text, url)
     
     if is_blocked:
         is_impossible = handler.should_terminate_with_impossible_task(blocker_type)
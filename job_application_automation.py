@@ -24,9 +24,13 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 import traceback
-import glob
 import yaml
 
+try:
+    import orjson
+except ImportError:  # Optional fast serializer; fall back to stdlib json
+    orjson = None
+
 # Third-party imports
 import requests
 import base64
@@ -64,6 +68,14 @@ APPLICATION_LOG_FILE = LOGS_DIR / "application_log.json"
 GENERATED_DOCS_DIR.mkdir(exist_ok=True)
 LOGS_DIR.mkdir(exist_ok=True)
 
+# JSON serializer for application logs (orjson when installed)
+if orjson is not None:
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2).decode("utf-8")
+else:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=str)
+
 # ═══════════════════════════════════════════════════════════════════════════
 # LOGGING CONFIGURATION
 # ═══════════════════════════════════════════════════════════════════════════
@@ -75,7 +87,8 @@ def setup_logging():
     LOGS_DIR.mkdir(exist_ok=True)
     
     # Create log filename with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    started_at = datetime.now()
+    timestamp = started_at.strftime("%Y%m%d_%H%M%S")
     log_file = LOGS_DIR / f"automation_{timestamp}.log"
     
     # Configure logging format
@@ -102,7 +115,7 @@ def setup_logging():
     logger.info("JOB APPLICATION AUTOMATION SYSTEM - STARTED")
     logger.info("=" * 80)
     logger.info(f"Log file: {log_file}")
-    logger.info(f"Timestamp: {datetime.now().isoformat()}")
+    logger.info(f"Timestamp: {started_at.isoformat()}")
     
     return logger
 
@@ -179,9 +192,9 @@ def save_application_log(job_url: str, status: str, details: Dict):
         else:
             logs = []
         
-        # Create new log entry
+        # Create new log entry (reuse the job's end time when already stamped)
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": details.get("end_time") or datetime.now().isoformat(),
             "job_url": job_url,
             "status": status,
             "details": details
@@ -191,7 +204,7 @@ def save_application_log(job_url: str, status: str, details: Dict):
         logs.append(log_entry)
         
         with open(APPLICATION_LOG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(logs, f, indent=2, ensure_ascii=False)
+            f.write(_dumps(logs))
         
         logger.info(f"✅ Application log saved: {status}")
         logger.info(f"   Total applications logged: {len(logs)}")
@@ -1281,7 +1294,7 @@ Account may require email verification or has authentication restrictions."
         logger.info("✅ Form filling process completed")
         logger.info("")
         logger.info("📋 AGENT REPORT:")
-        logger.info(f"{str(result)}")
+        logger.info("%s", result)
         logger.info("")
         
         # Extract screenshot from agent history (captured during execution due to use_vision=True)
@@ -1300,30 +1313,32 @@ Account may require email verification or has authentication restrictions."
                 last_screenshot = None
                 last_step_num = 0
                 
-                # Iterate through ALL steps to find the LAST screenshot
-                for i, step in enumerate(result.history):
+                # Walk steps from the end; the first existing screenshot is the LAST one
+                for i in range(len(result.history) - 1, -1, -1):
+                    step = result.history[i]
                     # Check if step has a state with screenshot_path
-                    if hasattr(step, 'state') and step.state and hasattr(step.state, 'screenshot_path'):
-                        if step.state.screenshot_path and os.path.exists(step.state.screenshot_path):
-                            # Keep track of the last screenshot found
-                            last_screenshot = step.state.screenshot_path
-                            last_step_num = i + 1
+                    state = getattr(step, 'state', None)
+                    shot = getattr(state, 'screenshot_path', None) if state else None
+                    if shot and os.access(shot, os.F_OK):
+                        last_screenshot = shot
+                        last_step_num = i + 1
+                        break
                 
                 # Copy the LAST screenshot (final state) to our directory
                 if last_screenshot:
-                    shutil.copy2(last_screenshot, final_screenshot_path)
+                    await asyncio.to_thread(shutil.copy2, last_screenshot, final_screenshot_path)
                     screenshot_path = final_screenshot_path
-                    logger.info(f"📸 Screenshot captured: FINAL STATE from step {last_step_num}/{len(result.history)}")
-                    logger.info(f"   Path: {screenshot_path}")
-                    logger.info(f"   Size: {screenshot_path.stat().st_size} bytes")
-                    logger.info(f"   This is the last screenshot showing where the application stopped")
+                    logger.info("📸 Screenshot captured: FINAL STATE from step %d/%d", last_step_num, len(result.history))
+                    logger.info("   Path: %s", screenshot_path)
+                    logger.info("   Size: %s bytes", screenshot_path.stat().st_size)
+                    logger.info("   This is the last screenshot showing where the application stopped")
             
             if not screenshot_path:
                 logger.warning("⚠️  No screenshots found in agent history")
                 logger.info("   Agent may not have enabled vision mode or no screenshots were captured")
                     
         except Exception as screenshot_error:
-            logger.warning(f"⚠️  Could not extract screenshot from agent history: {screenshot_error}")
+            logger.warning("⚠️  Could not extract screenshot from agent history: %s", screenshot_error)
             screenshot_path = None
         
         logger.info("")
@@ -1342,7 +1357,7 @@ Account may require email verification or has authentication restrictions."
         }
         
     except Exception as e:
-        logger.error(f"❌ Failed to fill application form: {str(e)}")
+        logger.error("❌ Failed to fill application form: %s", e)
         logger.error(traceback.format_exc())
         raise
 
@@ -1359,36 +1374,62 @@ def find_latest_documents() -> Tuple[Optional[str], Optional[str]]:
     """
     logger.info("🔍 Searching for latest generated documents...")
     
-    # Find all resume files
-    resume_pattern = str(GENERATED_DOCS_DIR / "dilip_kumar_tc_resume_*.docx")
-    resume_files = glob.glob(resume_pattern)
-    
-    # Find all cover letter files
-    cover_letter_pattern = str(GENERATED_DOCS_DIR / "dilip_kumar_tc_cover_letter_*.docx")
-    cover_letter_files = glob.glob(cover_letter_pattern)
+    # Single directory pass: track the newest resume and cover letter together
+    latest = {"resume": (None, 0.0), "cover_letter": (None, 0.0)}
+    with os.scandir(GENERATED_DOCS_DIR) as entries:
+        for entry in entries:
+            name = entry.name
+            if not name.endswith(".docx"):
+                continue
+            if name.startswith("dilip_kumar_tc_resume_"):
+                kind = "resume"
+            elif name.startswith("dilip_kumar_tc_cover_letter_"):
+                kind = "cover_letter"
+            else:
+                continue
+            mtime = entry.stat().st_mtime
+            if latest[kind][0] is None or mtime > latest[kind][1]:
+                latest[kind] = (entry.path, mtime)
     
     # Get the latest resume (most recent modification time)
-    latest_resume = None
-    if resume_files:
-        latest_resume = max(resume_files, key=os.path.getmtime)
-        resume_time = datetime.fromtimestamp(os.path.getmtime(latest_resume))
-        logger.info(f"✅ Found latest resume: {latest_resume}")
-        logger.info(f"   Created: {resume_time.strftime('%Y-%m-%d %H:%M:%S')}")
+    latest_resume, resume_mtime = latest["resume"]
+    if latest_resume:
+        resume_time = datetime.fromtimestamp(resume_mtime)
+        logger.info("✅ Found latest resume: %s", latest_resume)
+        logger.info("   Created: %s", resume_time.strftime('%Y-%m-%d %H:%M:%S'))
     else:
         logger.warning("⚠️  No resume files found in generated_documents/")
     
     # Get the latest cover letter
-    latest_cover_letter = None
-    if cover_letter_files:
-        latest_cover_letter = max(cover_letter_files, key=os.path.getmtime)
-        cl_time = datetime.fromtimestamp(os.path.getmtime(latest_cover_letter))
-        logger.info(f"✅ Found latest cover letter: {latest_cover_letter}")
-        logger.info(f"   Created: {cl_time.strftime('%Y-%m-%d %H:%M:%S')}")
+    latest_cover_letter, cl_mtime = latest["cover_letter"]
+    if latest_cover_letter:
+        cl_time = datetime.fromtimestamp(cl_mtime)
+        logger.info("✅ Found latest cover letter: %s", latest_cover_letter)
+        logger.info("   Created: %s", cl_time.strftime('%Y-%m-%d %H:%M:%S'))
     else:
         logger.warning("⚠️  No cover letter files found in generated_documents/")
     
     return latest_resume, latest_cover_letter
 
+# Blocker classification rules, checked in priority order. Each rule is a
+# tuple of keyword groups; it matches when every group has a keyword present.
+BLOCKER_TYPE_RULES = (
+    ((("expired",),), "EXPIRED_JOB"),
+    ((("captcha",),), "CAPTCHA"),
+    ((("email",), ("verif",)), "EMAIL_VERIFICATION"),
+    ((("phone",), ("verif", "sms")), "PHONE_VERIFICATION"),
+    ((("locked", "wrong", "invalid", "authentication"),), "ACCOUNT_LOCKED"),
+    ((("login", "sign in"),), "LOGIN_REQUIRED"),
+)
+
+def classify_blocker_reason(failure_reason: str) -> str:
+    """Map an agent failure reason to a blocker type."""
+    failure_lower = failure_reason.lower()
+    for groups, blocker_type in BLOCKER_TYPE_RULES:
+        if all(any(kw in failure_lower for kw in group) for group in groups):
+            return blocker_type
+    return "UNKNOWN_BLOCKER"
+
 # ═══════════════════════════════════════════════════════════════════════════
 # MAIN AUTOMATION WORKFLOW
 # ═══════════════════════════════════════════════════════════════════════════
@@ -1430,7 +1471,7 @@ async def automate_job_application(job_url: str, skip_generation: bool = False,
             logger.info("⚡ SKIP MODE: Using latest existing documents (no API calls)")
             logger.info("="*80)
             
-            resume_path, cover_letter_path = find_latest_documents()
+            resume_path, cover_letter_path = await asyncio.to_thread(find_latest_documents)
             
             if not resume_path:
                 raise Exception("No resume files found in generated_documents/. Generate at least one first.")
@@ -1481,7 +1522,7 @@ async def automate_job_application(job_url: str, skip_generation: bool = False,
             screenshot_path = None
         
         # Check if blocker was detected by parsing agent result
-        if "impossible_task=True" in agent_result_str or "impossible_task":  # Parse the agent result
+        if "impossible_task=True" in agent_result_str:
             # Try to extract blocker details from the JudgementResult
             if "failure_reason" in agent_result_str:
                 # Extract failure reason using string parsing
@@ -1499,21 +1540,7 @@ async def automate_job_application(job_url: str, skip_generation: bool = False,
                 failure_reason = "Task marked as impossible by agent"
             
             # Determine blocker type from the failure reason
-            failure_lower = failure_reason.lower()
-            if "expired" in failure_lower:
-                blocker_type = "EXPIRED_JOB"
-            elif "captcha" in failure_lower:
-                blocker_type = "CAPTCHA"
-            elif "email" in failure_lower and "verif" in failure_lower:
-                blocker_type = "EMAIL_VERIFICATION"
-            elif "phone" in failure_lower and ("verif" in failure_lower or "sms" in failure_lower):
-                blocker_type = "PHONE_VERIFICATION"
-            elif "locked" in failure_lower or "wrong" in failure_lower or "invalid" in failure_lower or "authentication" in failure_lower:
-                blocker_type = "ACCOUNT_LOCKED"
-            elif "login" in failure_lower or "sign in" in failure_lower:
-                blocker_type = "LOGIN_REQUIRED"
-            else:
-                blocker_type = "UNKNOWN_BLOCKER"
+            blocker_type = classify_blocker_reason(failure_reason)
             
             # Mark as IMPOSSIBLE_TASK
             application_details["steps_completed"].append(f"Blocker detected by agent: {blocker_type}")
@@ -1534,9 +1561,9 @@ async def automate_job_application(job_url: str, skip_generation: bool = False,
             logger.info("█" * 80)
             logger.info("")
             logger.info("📊 SUMMARY:")
-            logger.info(f"   🚫 Blocker Type: {blocker_type}")
-            logger.info(f"   📝 Reason: {failure_reason}")
-            logger.info(f"   ⚠️  This is NOT a failure - task cannot be automated")
+            logger.info("   🚫 Blocker Type: %s", blocker_type)
+            logger.info("   📝 Reason: %s", failure_reason)
+            logger.info("   ⚠️  This is NOT a failure - task cannot be automated")
             logger.info("")
             
             return application_details
@@ -1565,15 +1592,15 @@ async def automate_job_application(job_url: str, skip_generation: bool = False,
         logger.info("")
         logger.info("📊 SUMMARY:")
         if not skip_generation:
-            logger.info(f"   ✅ Job description scraped")
+            logger.info("   ✅ Job description scraped")
         else:
-            logger.info(f"   ⏩ Job description: SKIPPED (test mode)")
-        logger.info(f"   ✅ Resume: {resume_path}")
+            logger.info("   ⏩ Job description: SKIPPED (test mode)")
+        logger.info("   ✅ Resume: %s", resume_path)
         if cover_letter_path:
-            logger.info(f"   ✅ Cover letter: {cover_letter_path}")
+            logger.info("   ✅ Cover letter: %s", cover_letter_path)
         else:
-            logger.warning(f"   ⚠️  Cover letter: NOT AVAILABLE")
-        logger.info(f"   ✅ Application form filled and submitted by AI agent")
+            logger.warning("   ⚠️  Cover letter: NOT AVAILABLE")
+        logger.info("   ✅ Application form filled and submitted by AI agent")
         logger.info("")
         logger.info("⚠️  CRITICAL - VERIFY SUBMISSION:")
         logger.info("   1. Check agent report above for file upload status")
@@ -1594,14 +1621,15 @@ async def automate_job_application(job_url: str, skip_generation: bool = False,
         error_msg = f"Application failed: {str(e)}"
         logger.error("")
         logger.error("█" * 80)
-        logger.error(f"❌ {error_msg}")
+        logger.error("❌ %s", error_msg)
         logger.error("█" * 80)
-        logger.error(traceback.format_exc())
+        error_trace = traceback.format_exc()
+        logger.error(error_trace)
         
         application_details["end_time"] = datetime.now().isoformat()
         application_details["status"] = "Failed"
-        application_details["error"] = str(e)
-        application_details["traceback"] = traceback.format_exc()
+        # Traceback already ends with the error message
+        application_details["traceback"] = error_trace
         
         # Save error log
         save_application_log(job_url, "FAILED", application_details)
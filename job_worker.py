@@ -8,8 +8,8 @@ Each worker has its own logging, timeout handling, and error isolation.
 
 Key Features:
 - Process-level isolation (no shared resources)
-- Immediate log flushing (no lost logs)
-- Signal-based timeout (30-minute default)
+- Non-blocking logging (records written by a background listener thread)
+- asyncio-based timeout (30-minute default, works on all platforms)
 - JSON-based result communication
 - Comprehensive error handling
 
@@ -20,22 +20,131 @@ Usage:
         job_json: JSON string with keys: name, apply_link, date_posted
         config_json: JSON string with keys: skip_generation, headless
         job_index: Integer index of this job (0-based)
+    
+    Or, to run many jobs in one process (see run_batch):
+        results = await run_batch(jobs, config, concurrency=4)
 """
 
 import asyncio
 import json
 import logging
+import logging.handlers
+import os
+import queue
 import sys
-import signal
+import threading
+import time
 import traceback
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, List, Optional
+
+try:
+    import orjson
+except ImportError:  # Optional fast serializer; fall back to stdlib json
+    orjson = None
 
 # Import existing automation function (no changes to it)
 from job_application_automation import automate_job_application
 
 
+# Directory the parent process reads result_{index:03d}.json files from
+RESULTS_DIR = Path('logs')
+RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+
+# Compact JSON encoder for result files (machine-read, so no indentation)
+if orjson is not None:
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, default=str)
+else:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':'), default=str).encode('utf-8')
+
+
+class _SafeFilenameTable(dict):
+    """str.translate table: keep alphanumerics, '-' and '_'; map everything else to '_'."""
+    
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        safe = char if char.isalnum() or char in ('-', '_') else '_'
+        self[codepoint] = safe
+        return safe
+
+
+SAFE_FILENAME_TABLE = _SafeFilenameTable()
+
+
+class SecondCachedFormatter(logging.Formatter):
+    """Formatter that reuses the formatted timestamp for records in the same second."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._time_cache = (None, '')  # (whole second, formatted text), swapped atomically
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        cached_second, cached_text = self._time_cache
+        if second != cached_second:
+            cached_text = super().formatTime(record, datefmt)
+            self._time_cache = (second, cached_text)
+        return cached_text
+
+
+class _NoOpLock:
+    """Stand-in for Handler.lock on handlers used by a single thread only."""
+    
+    def acquire(self, *args, **kwargs) -> bool:
+        return True
+    
+    def release(self) -> None:
+        pass
+    
+    def __enter__(self) -> '_NoOpLock':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        pass
+    
+    def _at_fork_reinit(self) -> None:
+        pass
+
+
+# File handlers shared by workers running in this process, keyed by log
+# path: [handler, reference count]. Subprocess workers each get their own.
+_FILE_HANDLERS: Dict[Path, List[Any]] = {}
+_FILE_HANDLERS_LOCK = threading.Lock()
+
+
+def acquire_file_handler(log_path: Path) -> logging.FileHandler:
+    """Return the pooled FileHandler for log_path, opening it on first use."""
+    with _FILE_HANDLERS_LOCK:
+        entry = _FILE_HANDLERS.get(log_path)
+        if entry is None:
+            handler = logging.FileHandler(log_path, encoding='utf-8')
+            handler.setLevel(logging.INFO)
+            handler.setFormatter(SecondCachedFormatter(
+                '%(asctime)s | %(levelname)-8s | %(message)s',
+                datefmt='%Y-%m-%d %H:%M:%S'
+            ))
+            entry = _FILE_HANDLERS[log_path] = [handler, 0]
+        entry[1] += 1
+        return entry[0]
+
+
+def release_file_handler(log_path: Path) -> None:
+    """Drop one reference to a pooled FileHandler, closing it when unused."""
+    with _FILE_HANDLERS_LOCK:
+        entry = _FILE_HANDLERS.get(log_path)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] > 0:
+            entry[0].flush()
+            return
+        del _FILE_HANDLERS[log_path]
+    entry[0].close()
+
+
 class TimeoutException(Exception):
     """Raised when worker process exceeds timeout."""
     pass
@@ -46,8 +155,8 @@ class JobWorker:
     Isolated worker process that runs a single job application.
     
     This class handles:
-    - Isolated logging with immediate flush
-    - Process-level timeout using signals
+    - Isolated logging via a background queue listener
+    - Timeout via asyncio.wait_for
     - Complete error isolation
     - JSON result serialization
     """
@@ -72,10 +181,16 @@ class JobWorker:
         self.skip_generation = config.get('skip_generation', False)
         self.headless = config.get('headless', False)
         self.timeout_minutes = config.get('timeout_minutes', 30)
+        self.timeout_seconds = self.timeout_minutes * 60
+        
+        # Two-digit job number used in the console prefix and automation logger name
+        self.job_label = f'{job_index+1:02d}'
         
         self.logger: Optional[logging.Logger] = None
         self.log_file_path: Optional[Path] = None
-        self.start_time = datetime.now()
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        self.start_time = datetime.now()  # Wall clock, used for the log filename
+        self._monotonic_start = time.monotonic()
         
     def setup_logging(self) -> None:
         """
@@ -84,7 +199,9 @@ class JobWorker:
         Creates:
         - File handler: logs/company_logs/{index:03d}_{company}_{timestamp}.log
         - Console handler with [JOB XX] prefix
-        - Immediate flush after every log entry
+        - QueueHandler on the worker logger (the automation logger propagates
+          to it); a QueueListener thread does the actual file/console writes
+          so logging never blocks the event loop
         """
         # Create company logs directory
         logs_dir = Path('logs/company_logs')
@@ -92,9 +209,7 @@ class JobWorker:
         
         # Create unique log file name
         timestamp = self.start_time.strftime('%Y%m%d_%H%M%S')
-        safe_company = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' 
-                              for c in self.company_name)[:50]
-        safe_company = safe_company.replace(' ', '_')
+        safe_company = self.company_name[:50].translate(SAFE_FILENAME_TABLE)
         
         log_filename = f"{self.job_index+1:03d}_{safe_company}_{timestamp}.log"
         self.log_file_path = logs_dir / log_filename
@@ -108,14 +223,8 @@ class JobWorker:
         # Remove any existing handlers
         self.logger.handlers.clear()
         
-        # File handler with immediate flush
-        file_handler = logging.FileHandler(self.log_file_path, encoding='utf-8')
-        file_handler.setLevel(logging.INFO)
-        file_formatter = logging.Formatter(
-            '%(asctime)s | %(levelname)-8s | %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        file_handler.setFormatter(file_formatter)
+        # File handler from the pool (written by the queue listener thread)
+        file_handler = acquire_file_handler(self.log_file_path)
         
         # Console handler with [JOB XX] prefix
         console_handler = logging.StreamHandler(sys.stdout)
@@ -125,29 +234,40 @@ class JobWorker:
             console_handler.stream.reconfigure(encoding='utf-8', errors='replace')
         except AttributeError:
             pass  # Python < 3.7 doesn't have reconfigure
-        console_formatter = logging.Formatter(
-            f'%(asctime)s | [JOB {self.job_index+1:02d}] | %(levelname)-8s | %(message)s',
+        console_formatter = SecondCachedFormatter(
+            f'%(asctime)s | [JOB {self.job_label}] | %(levelname)-8s | %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         console_handler.setFormatter(console_formatter)
-        
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
-        
-        # IMPORTANT: Also configure the automation logger to write to same file
-        # This ensures all automation steps are captured in the worker log
-        automation_logger = logging.getLogger(f"JobAutomation_Job{self.job_index+1:02d}")
+        # Only this worker's listener thread emits to the console handler, so
+        # skip the per-record RLock. The pooled file handler keeps its lock
+        # because in-process workers may share it across listener threads.
+        console_handler.lock = _NoOpLock()
+        
+        # The worker logger only enqueues records; the listener thread writes them
+        log_queue = queue.Queue(-1)
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        
+        # IMPORTANT: Also route the automation logger into the same file
+        # It has no handlers of its own and propagates to the worker logger,
+        # so every automation record is handled exactly once
+        automation_logger = logging.getLogger(f"JobAutomation_Job{self.job_label}")
         automation_logger.setLevel(logging.INFO)
-        automation_logger.propagate = False
         automation_logger.handlers.clear()
-        automation_logger.addHandler(file_handler)
-        automation_logger.addHandler(console_handler)
+        automation_logger.parent = self.logger
+        automation_logger.propagate = True
+        
+        self._listener = logging.handlers.QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        self._listener.start()
         
     def log_and_flush(self, level: str, message: str) -> None:
         """
-        Log message and immediately flush to disk.
+        Log message via the worker queue.
         
-        This ensures no logs are lost even if process is killed.
+        The queue listener thread writes (and flushes) each record as soon
+        as it is dequeued, so the caller never waits on disk I/O.
         
         Args:
             level: Logging level (info, warning, error, etc.)
@@ -156,25 +276,16 @@ class JobWorker:
         if self.logger:
             log_func = getattr(self.logger, level.lower(), self.logger.info)
             log_func(message)
-            
-            # CRITICAL: Flush all handlers immediately
-            for handler in self.logger.handlers:
-                handler.flush()
     
-    def setup_timeout_handler(self) -> None:
-        """
-        Set up process-level timeout using SIGALRM.
-        
-        If worker exceeds timeout, SIGALRM is raised and TimeoutException is thrown.
-        Note: signal.alarm() only works on Unix systems.
-        """
-        def timeout_handler(signum, frame):
-            raise TimeoutException(f"Worker timeout after {self.timeout_minutes} minutes")
-        
-        # Only set up signal handler on Unix systems
-        if hasattr(signal, 'SIGALRM'):
-            signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(self.timeout_minutes * 60)  # Convert to seconds
+    def stop_logging(self) -> None:
+        """Drain the log queue, close the console handler and release the file handler."""
+        if self._listener:
+            self._listener.stop()
+            _, console_handler = self._listener.handlers
+            console_handler.flush()
+            console_handler.close()
+            release_file_handler(self.log_file_path)
+            self._listener = None
     
     async def run(self) -> Dict[str, Any]:
         """
@@ -218,12 +329,18 @@ class JobWorker:
             # Run the automation (calls existing function - no changes needed)
             self.log_and_flush('info', '🚀 Starting automation process...')
             
-            automation_result = await automate_job_application(
-                job_url=self.job_url,
-                skip_generation=self.skip_generation,
-                job_index=self.job_index,
-                headless=self.headless
-            )
+            try:
+                automation_result = await asyncio.wait_for(
+                    automate_job_application(
+                        job_url=self.job_url,
+                        skip_generation=self.skip_generation,
+                        job_index=self.job_index,
+                        headless=self.headless
+                    ),
+                    timeout=self.timeout_seconds
+                )
+            except asyncio.TimeoutError as e:
+                raise TimeoutException(f"Worker timeout after {self.timeout_minutes} minutes") from e
             
             # Success
             result['status'] = 'success'
@@ -255,17 +372,13 @@ class JobWorker:
             self.log_and_flush('error', '=' * 80)
             self.log_and_flush('error', f'❌ WORKER FAILED: {e}')
             self.log_and_flush('error', '=' * 80)
-            self.log_and_flush('error', 'Traceback:')
-            for line in traceback.format_exc().split('\n'):
-                if line.strip():
-                    self.log_and_flush('error', line)
+            self.log_and_flush('error', 'Traceback:\n' + traceback.format_exc().rstrip())
             self.log_and_flush('error', '=' * 80)
             self.log_and_flush('error', '')
             
         finally:
             # Calculate duration
-            end_time = datetime.now()
-            duration = (end_time - self.start_time).total_seconds()
+            duration = time.monotonic() - self._monotonic_start
             result['duration_seconds'] = duration
             
             # Final log flush
@@ -273,14 +386,93 @@ class JobWorker:
             self.log_and_flush('info', f'📊 Final Status: {result["status"].upper()}')
             
             # Ensure all logs are written
-            if self.logger:
-                for handler in self.logger.handlers:
-                    handler.flush()
-                    handler.close()
+            self.stop_logging()
         
         return result
 
 
+def _error_result(index: int, error: str, job_data: Any = None) -> Dict[str, Any]:
+    """Result dictionary for a job that failed before its worker could run."""
+    job_data = job_data if isinstance(job_data, dict) else {}
+    return {
+        'status': 'failed',
+        'job_index': index,
+        'company_name': job_data.get('name', 'Unknown'),
+        'job_url': job_data.get('apply_link', ''),
+        'error': error,
+        'log_file': None,
+        'duration_seconds': 0.0
+    }
+
+
+async def run_batch(jobs: List[Dict[str, str]], config: Dict[str, Any], concurrency: int = 4,
+                    should_stop: Optional[Callable[[], bool]] = None) -> List[Dict[str, Any]]:
+    """
+    Run several jobs concurrently inside this process.
+    
+    An alternative to one subprocess per job: `concurrency` coroutines pull
+    jobs from an asyncio.Queue and run each through its own JobWorker (own
+    log file, own timeout), sharing one interpreter and event loop. Use the
+    subprocess mode when hard isolation between jobs is needed.
+    
+    Args:
+        jobs: List of job data dictionaries
+        config: Worker configuration (same keys as JobWorker)
+        concurrency: Number of jobs running at the same time
+        should_stop: Optional callback; once it returns True, jobs not yet
+            started are skipped (jobs already running finish normally)
+        
+    Returns:
+        List of result dictionaries, in job order
+    """
+    job_queue: asyncio.Queue = asyncio.Queue()
+    for index, job_data in enumerate(jobs):
+        job_queue.put_nowait((index, job_data))
+    
+    results: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+    
+    async def consume() -> None:
+        while True:
+            index, job_data = await job_queue.get()
+            try:
+                if should_stop is not None and should_stop():
+                    results[index] = _error_result(index, 'Batch interrupted by user', job_data)
+                    continue
+                
+                worker = JobWorker(job_data, config, index)
+                worker.setup_logging()
+                results[index] = await worker.run()
+            except Exception as e:
+                # A bad job must not take this consumer (and the rest of the queue) down
+                results[index] = _error_result(index, f'Worker initialization failed: {str(e)}', job_data)
+            finally:
+                job_queue.task_done()
+    
+    consumers = [asyncio.create_task(consume()) for _ in range(max(1, concurrency))]
+    try:
+        await job_queue.join()
+    finally:
+        for consumer in consumers:
+            consumer.cancel()
+        await asyncio.gather(*consumers, return_exceptions=True)
+    
+    return results
+
+
+def write_result_file(index: int, result: Dict[str, Any]) -> Path:
+    """
+    Atomically write the worker result JSON for the parent process.
+    
+    The result is written to a temporary file and moved into place with
+    os.replace, so the parent never reads a partially written file.
+    """
+    result_file = RESULTS_DIR / f'result_{index:03d}.json'
+    tmp_file = RESULTS_DIR / f'result_{index:03d}.json.tmp'
+    tmp_file.write_bytes(_dumps(result))
+    os.replace(tmp_file, result_file)
+    return result_file
+
+
 def worker_main(job_json: str, config_json: str, job_index: str) -> int:
     """
     Main entry point for worker process.
@@ -312,21 +504,14 @@ def worker_main(job_json: str, config_json: str, job_index: str) -> int:
         # Set up logging
         worker.setup_logging()
         
-        # Set up timeout handler (Unix only)
-        if hasattr(signal, 'SIGALRM'):
-            worker.setup_timeout_handler()
-        
         # Run automation
         result = asyncio.run(worker.run())
         
         # Write result to JSON file (avoid stdout pipe deadlock)
-        result_file = Path('logs') / f'result_{index:03d}.json'
-        result_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(result_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2)
+        write_result_file(index, result)
         
         # Print brief completion message (won't overflow pipe)
-        print(f'Worker {index} completed: {result["status"]}')
+        print(f'Worker {index} completed: {result["status"]}', flush=True)
         
         # Return exit code
         return 0 if result['status'] == 'success' else 1
@@ -334,23 +519,12 @@ def worker_main(job_json: str, config_json: str, job_index: str) -> int:
     except Exception as e:
         # Catastrophic failure (couldn't even set up worker)
         index = int(job_index) if job_index.isdigit() else -1
-        error_result = {
-            'status': 'failed',
-            'job_index': index,
-            'company_name': 'Unknown',
-            'job_url': '',
-            'error': f'Worker initialization failed: {str(e)}',
-            'log_file': None,
-            'duration_seconds': 0.0
-        }
+        error_result = _error_result(index, f'Worker initialization failed: {str(e)}')
         
         # Write error result to file
-        result_file = Path('logs') / f'result_{index:03d}.json'
-        result_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(result_file, 'w', encoding='utf-8') as f:
-            json.dump(error_result, f, indent=2)
+        write_result_file(index, error_result)
         
-        print(f'Worker {index} failed during init: {str(e)}')
+        print(f'Worker {index} failed during init: {str(e)}', flush=True)
 
 
 if __name__ == '__main__':
@@ -6,12 +6,104 @@ Log Parser for Job Application Automation
 Parses worker log files to extract application steps and timeline.
 """
 
+import mmap
 import re
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
 
 
+# Log line layout: "<timestamp> | <LEVEL> | <message>"
+# Applied with finditer over the whole (memory-mapped) file, so it is
+# anchored per line and never crosses a line break.
+LOG_LINE_PATTERN = re.compile(
+    rb'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) \| (\w+)[^\S\n]+\| (.+?)\r?$',
+    re.MULTILINE
+)
+
+# Step patterns to detect, in priority order: (pattern, step name, step level)
+STEP_DEFINITIONS = (
+    (r'WORKER STARTED:', 'Worker Started', 'info'),
+    (r'JOB APPLICATION AUTOMATION STARTED', 'Automation Started', 'info'),
+    (r'SKIP MODE: Using latest existing documents', 'Using Existing Documents', 'info'),
+    (r'User profile loaded', 'Profile Loaded', 'info'),
+    (r'Job description scraped', 'Job Description Scraped', 'info'),
+    (r'Resume generated', 'Resume Generated', 'success'),
+    (r'Resume saved:', 'Resume Saved', 'success'),
+    (r'Cover letter generated', 'Cover Letter Generated', 'success'),
+    (r'Cover letter SKIPPED', 'Cover Letter Skipped', 'warning'),
+    (r'Launching browser', 'Browser Launched', 'info'),
+    (r'Navigating to job URL', 'Navigated to Job', 'info'),
+    (r'Filling application form', 'Filling Form', 'info'),
+    (r'Screenshot captured:', 'Screenshot Captured', 'info'),
+    (r'APPLICATION COMPLETED SUCCESSFULLY', 'Application Completed', 'success'),
+    (r'WORKER FAILED:', 'Worker Failed', 'error'),
+    (r'WORKER TIMEOUT:', 'Worker Timeout', 'error'),
+    (r'impossible_task=True', 'Blocker Detected', 'warning'),
+    (r'EXPIRED_JOB', 'Job Expired', 'error'),
+    (r'CAPTCHA', 'CAPTCHA Detected', 'error'),
+    (r'EMAIL_VERIFICATION', 'Email Verification Required', 'error'),
+)
+
+# All step patterns fused into one regex. Each alternative is an anchored
+# lookahead with a single capture group, tried in list order, so
+# match().lastindex identifies the first definition found anywhere in the
+# message (same priority as checking the patterns one by one).
+STEP_PATTERN = re.compile(
+    '|'.join(f'(?=.*?({pattern}))' for pattern, _, _ in STEP_DEFINITIONS).encode('ascii'),
+    re.IGNORECASE
+)
+STEP_META = tuple((step_name, step_level) for _, step_name, step_level in STEP_DEFINITIONS)
+
+# Cheap prefilter: every step pattern is a literal containing its own first
+# word, so a line whose lowercased bytes contain none of these words cannot
+# match STEP_PATTERN. Most log lines are rejected here without the regex.
+STEP_KEYWORDS = tuple(dict.fromkeys(
+    pattern.split()[0].lower().encode('ascii') for pattern, _, _ in STEP_DEFINITIONS
+))
+
+
+# Timeline HTML: (icon, border color) per step level and static fragments
+STEP_LEVEL_STYLES = {
+    'success': ('✅', '#10b981'),
+    'error': ('❌', '#ef4444'),
+    'warning': ('⚠️', '#f59e0b'),
+}
+DEFAULT_STEP_STYLE = ('▶️', '#3b82f6')
+
+TIMELINE_HTML_OPEN = '\n'.join([
+    '<div style="margin-top: 20px;">',
+    '<div style="position: relative; padding-left: 30px;">',
+    '<div style="position: absolute; left: 10px; top: 0; bottom: 0; width: 2px; background: #e5e7eb;"></div>',
+])
+TIMELINE_HTML_CLOSE = '</div>\n</div>'
+
+STEP_HTML_TEMPLATE = '''
+        <div style="position: relative; margin-bottom: 15px;">
+            <div style="position: absolute; left: -25px; width: 20px; height: 20px; background: white; border: 2px solid {border_color}; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-size: 10px;">
+                {icon}
+            </div>
+            <div style="background: #f9fafb; border: 1px solid #e5e7eb; border-radius: 8px; padding: 12px;">
+                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 5px;">
+                    <strong style="color: #1f2937; font-size: 0.95em;">{name}</strong>
+                    <span style="color: #6b7280; font-size: 0.85em;">+{elapsed_min:.1f}m</span>
+                </div>
+                <div style="color: #4b5563; font-size: 0.85em; font-family: 'Courier New', monospace;">
+                    {timestamp}
+                </div>
+            </div>
+        </div>
+        '''
+
+
+def _parse_timestamp(timestamp_str: str) -> datetime:
+    """Parse a fixed-layout 'YYYY-MM-DD HH:MM:SS' timestamp without strptime."""
+    return datetime(
+        int(timestamp_str[0:4]), int(timestamp_str[5:7]), int(timestamp_str[8:10]),
+        int(timestamp_str[11:13]), int(timestamp_str[14:16]), int(timestamp_str[17:19])
+    )
+
+
 def parse_worker_log(log_file_path: str) -> Dict:
     """
     Parse a worker log file to extract application steps.
@@ -42,40 +134,20 @@ def parse_worker_log(log_file_path: str) -> Dict:
     status = 'UNKNOWN'
     error = None
     
-    # Step patterns to detect
-    step_patterns = [
-        (r'WORKER STARTED:', 'Worker Started', 'info'),
-        (r'JOB APPLICATION AUTOMATION STARTED', 'Automation Started', 'info'),
-        (r'SKIP MODE: Using latest existing documents', 'Using Existing Documents', 'info'),
-        (r'User profile loaded', 'Profile Loaded', 'info'),
-        (r'Job description scraped', 'Job Description Scraped', 'info'),
-        (r'Resume generated', 'Resume Generated', 'success'),
-        (r'Resume saved:', 'Resume Saved', 'success'),
-        (r'Cover letter generated', 'Cover Letter Generated', 'success'),
-        (r'Cover letter SKIPPED', 'Cover Letter Skipped', 'warning'),
-        (r'Launching browser', 'Browser Launched', 'info'),
-        (r'Navigating to job URL', 'Navigated to Job', 'info'),
-        (r'Filling application form', 'Filling Form', 'info'),
-        (r'Screenshot captured:', 'Screenshot Captured', 'info'),
-        (r'APPLICATION COMPLETED SUCCESSFULLY', 'Application Completed', 'success'),
-        (r'WORKER FAILED:', 'Worker Failed', 'error'),
-        (r'WORKER TIMEOUT:', 'Worker Timeout', 'error'),
-        (r'impossible_task=True', 'Blocker Detected', 'warning'),
-        (r'EXPIRED_JOB', 'Job Expired', 'error'),
-        (r'CAPTCHA', 'CAPTCHA Detected', 'error'),
-        (r'EMAIL_VERIFICATION', 'Email Verification Required', 'error'),
-    ]
+    # Parse log file (only lines with a timestamp are decoded)
+    with open(log_path, 'rb') as f:
+        try:
+            log_data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            log_data = b''  # Empty file cannot be mapped
     
-    # Parse log file
-    with open(log_path, 'r', encoding='utf-8') as f:
-        for line in f:
+    try:
+        for match in LOG_LINE_PATTERN.finditer(log_data):
             # Extract timestamp and message
-            match = re.match(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) \| (\w+)\s+\| (.+)', line)
-            if not match:
-                continue
-            
-            timestamp_str, level, message = match.groups()
-            timestamp = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S')
+            raw_timestamp, _, raw_message = match.groups()
+            timestamp_str = raw_timestamp.decode('ascii')
+            message = raw_message.decode('utf-8', errors='replace')
+            timestamp = _parse_timestamp(timestamp_str)
             
             # Track start/end times
             if start_time is None:
@@ -93,19 +165,26 @@ def parse_worker_log(log_file_path: str) -> Dict:
                 error = message
             
             # Match step patterns
-            for pattern, step_name, step_level in step_patterns:
-                if re.search(pattern, message, re.IGNORECASE):
-                    # Extract additional details if present
-                    details = message.strip()
-                    
-                    steps.append({
-                        'timestamp': timestamp_str,
-                        'name': step_name,
-                        'level': step_level,
-                        'details': details,
-                        'elapsed_seconds': (timestamp - start_time).total_seconds() if start_time else 0
-                    })
-                    break
+            lowered = raw_message.lower()
+            if not any(keyword in lowered for keyword in STEP_KEYWORDS):
+                continue
+            step_match = STEP_PATTERN.match(raw_message)
+            if step_match:
+                step_name, step_level = STEP_META[step_match.lastindex - 1]
+                
+                # Extract additional details if present
+                details = message.strip()
+                
+                steps.append({
+                    'timestamp': timestamp_str,
+                    'name': step_name,
+                    'level': step_level,
+                    'details': details,
+                    'elapsed_seconds': (timestamp - start_time).total_seconds() if start_time else 0
+                })
+    finally:
+        if isinstance(log_data, mmap.mmap):
+            log_data.close()
     
     # Calculate duration
     duration = (end_time - start_time).total_seconds() if start_time and end_time else 0
@@ -133,51 +212,19 @@ def format_step_timeline_html(parsed_log: Dict) -> str:
     if not parsed_log['steps']:
         return '<p style="color: #6b7280; font-style: italic;">No steps recorded</p>'
     
-    html_parts = []
-    html_parts.append('<div style="margin-top: 20px;">')
-    html_parts.append('<div style="position: relative; padding-left: 30px;">')
-    
-    # Timeline line
-    html_parts.append('<div style="position: absolute; left: 10px; top: 0; bottom: 0; width: 2px; background: #e5e7eb;"></div>')
-    
+    step_html = []
     for step in parsed_log['steps']:
         # Choose icon and color based on level
-        if step['level'] == 'success':
-            icon = '✅'
-            border_color = '#10b981'
-        elif step['level'] == 'error':
-            icon = '❌'
-            border_color = '#ef4444'
-        elif step['level'] == 'warning':
-            icon = '⚠️'
-            border_color = '#f59e0b'
-        else:
-            icon = '▶️'
-            border_color = '#3b82f6'
-        
-        elapsed_min = step['elapsed_seconds'] / 60
-        
-        html_parts.append(f'''
-        <div style="position: relative; margin-bottom: 15px;">
-            <div style="position: absolute; left: -25px; width: 20px; height: 20px; background: white; border: 2px solid {border_color}; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-size: 10px;">
-                {icon}
-            </div>
-            <div style="background: #f9fafb; border: 1px solid #e5e7eb; border-radius: 8px; padding: 12px;">
-                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 5px;">
-                    <strong style="color: #1f2937; font-size: 0.95em;">{step['name']}</strong>
-                    <span style="color: #6b7280; font-size: 0.85em;">+{elapsed_min:.1f}m</span>
-                </div>
-                <div style="color: #4b5563; font-size: 0.85em; font-family: 'Courier New', monospace;">
-                    {step['timestamp']}
-                </div>
-            </div>
-        </div>
-        ''')
-    
-    html_parts.append('</div>')
-    html_parts.append('</div>')
+        icon, border_color = STEP_LEVEL_STYLES.get(step['level'], DEFAULT_STEP_STYLE)
+        step_html.append(STEP_HTML_TEMPLATE.format(
+            icon=icon,
+            border_color=border_color,
+            name=step['name'],
+            elapsed_min=step['elapsed_seconds'] / 60,
+            timestamp=step['timestamp']
+        ))
     
-    return '\n'.join(html_parts)
+    return '\n'.join([TIMELINE_HTML_OPEN, *step_html, TIMELINE_HTML_CLOSE])
 
 
 if __name__ == '__main__':
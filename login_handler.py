@@ -14,12 +14,117 @@ Date: February 12, 2026
 """
 
 import logging
-from typing import Optional, Dict, Tuple
+from functools import lru_cache
+from typing import Callable, Optional, Dict, List, Tuple
+from urllib.parse import urlsplit
 import re
 
+try:
+    import hyperscan  # python-hyperscan (optional, x86-64 only)
+except ImportError:
+    hyperscan = None
+
+try:
+    import ahocorasick  # pyahocorasick (optional)
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 
+def build_literal_matcher(literals) -> Callable[[str], bool]:
+    """
+    Build a one-pass "does text contain any of these literals" test.
+    
+    Uses a Hyperscan database when python-hyperscan is installed, then an
+    Aho-Corasick automaton when pyahocorasick is, else a single compiled
+    regex alternation. Either way the text is scanned once for all
+    literals instead of once per literal.
+    
+    Literals that contain another literal ("member login" vs "login") can
+    never decide the result, so they are dropped before building.
+    """
+    unique = list(dict.fromkeys(literals))
+    literals = [
+        literal for literal in unique
+        if not any(other != literal and other in literal for other in unique)
+    ]
+    
+    if hyperscan is not None and all(literals):
+        return _build_hyperscan_matcher(literals)
+    
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for literal in literals:
+            automaton.add_word(literal, literal)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+    
+    pattern = re.compile("|".join(re.escape(literal) for literal in literals))
+    return lambda text: pattern.search(text) is not None
+
+
+def _build_hyperscan_matcher(literals) -> Callable[[str], bool]:
+    """Hyperscan backend for build_literal_matcher (stops at the first hit)."""
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[re.escape(literal).encode('utf-8') for literal in literals],
+        ids=list(range(len(literals))),
+        elements=len(literals),
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(literals),
+    )
+    scan_terminated = getattr(hyperscan, 'ScanTerminated', ())
+    
+    def on_match(match_id, start, end, flags, context):
+        context.append(match_id)
+        return True  # Halt the scan: one hit is enough
+    
+    def matcher(text: str) -> bool:
+        hits = []
+        try:
+            # UTF-8 is self-synchronizing: a byte-level hit is a str-level hit
+            database.scan(text.encode('utf-8'), match_event_handler=on_match, context=hits)
+        except scan_terminated:
+            pass
+        return bool(hits)
+    
+    return matcher
+
+
+def build_host_trie(patterns: Dict[str, List[str]]) -> Tuple[Dict, Tuple[Tuple[str, str], ...]]:
+    """
+    Split ATS URL patterns into a reverse-domain trie and a fallback list.
+    
+    Hostname suffixes ("jobs.greenhouse.io") go into a trie keyed on labels
+    from right to left ("io" -> "greenhouse" -> "jobs"), with the platform
+    stored under the None key. Patterns that are not plain host suffixes
+    ("lever.co/apply", "careers.") are returned as (pattern, platform)
+    pairs for a substring check. There are only a couple of these, and
+    plain `in` checks beat a combined regex alternation on them (the
+    priority-preserving lookahead alternation measured ~10x slower).
+    
+    Args:
+        patterns: Platform name -> list of URL patterns
+        
+    Returns:
+        (host_trie, fallback_patterns)
+    """
+    trie: Dict = {}
+    fallbacks: List[Tuple[str, str]] = []
+    
+    for platform, platform_patterns in patterns.items():
+        for pattern in platform_patterns:
+            if "/" in pattern or pattern.endswith("."):
+                fallbacks.append((pattern, platform))
+                continue
+            node = trie
+            for label in reversed(pattern.split(".")):
+                node = node.setdefault(label, {})
+            node.setdefault(None, platform)
+    
+    return trie, tuple(fallbacks)
+
+
 class LoginDetector:
     """
     Detects login/sign-in requirements on job application pages.
@@ -42,6 +147,16 @@ class LoginDetector:
         "applicant login",
     ]
     
+    # Page text is lowercased and scanned in chunks of this many characters,
+    # so a login wall near the top is found without copying the whole page
+    LOGIN_SCAN_CHUNK_CHARS = 8192
+    
+    # One-pass matcher over LOGIN_INDICATORS and the chunk overlap it needs,
+    # built once on the class and rebuilt only if the list changes
+    _login_matcher: Optional[Callable[[str], bool]] = None
+    _login_matcher_source: Tuple[str, ...] = ()
+    _login_chunk_overlap: int = 0
+    
     # ATS-specific patterns
     ATS_PATTERNS = {
         "greenhouse": [
@@ -82,6 +197,9 @@ class LoginDetector:
         ]
     }
     
+    # Lookup structures derived from ATS_PATTERNS (rebuild if it changes)
+    _ATS_HOST_TRIE, _ATS_URL_FALLBACKS = build_host_trie(ATS_PATTERNS)
+    
     @classmethod
     def detect_ats_platform(cls, url: str) -> Optional[str]:
         """
@@ -93,15 +211,67 @@ class LoginDetector:
         Returns:
             ATS platform name or None
         """
-        url_lower = url.lower()
+        # ATS URLs are nearly always lowercase already: skip the copy then
+        url_lower = url if url.islower() else url.lower()
+        return cls._detect_ats_platform_cached(url_lower)
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _detect_ats_platform_cached(url_lower: str) -> Optional[str]:
+        """
+        Match a lowercased URL against ATS_PATTERNS (memoized).
+        
+        The host is walked label by label through the reverse-domain trie
+        and the most specific suffix wins. Only if no host suffix matches
+        are the non-host patterns ("lever.co/apply", "careers.") checked
+        against the whole URL, which is why the cache is keyed on the URL.
+        """
+        try:
+            split = urlsplit(url_lower if "//" in url_lower else "//" + url_lower)
+            host = split.hostname or ""
+        except ValueError:  # e.g. malformed IPv6 netloc
+            host = ""
+        
+        platform = LoginDetector._platform_for_host(host)
+        if platform:
+            return platform
         
-        for platform, patterns in cls.ATS_PATTERNS.items():
-            for pattern in patterns:
-                if pattern in url_lower:
-                    return platform
+        for pattern, fallback_platform in LoginDetector._ATS_URL_FALLBACKS:
+            if pattern in url_lower:
+                return fallback_platform
         
         return None
     
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _platform_for_host(host: str) -> Optional[str]:
+        """
+        Map a hostname to its ATS platform via the reverse-domain trie (memoized).
+        
+        Job URLs are nearly all unique, but they share a few dozen hosts, so
+        this per-host cache hits even when the per-URL cache above misses.
+        """
+        platform = None
+        node = LoginDetector._ATS_HOST_TRIE
+        for label in reversed(host.split(".")):
+            node = node.get(label)
+            if node is None:
+                break
+            platform = node.get(None, platform)
+        
+        return platform
+    
+    @classmethod
+    def _get_login_matcher(cls) -> Tuple[Callable[[str], bool], int]:
+        """Return the LOGIN_INDICATORS matcher and chunk overlap, building them on first use."""
+        source = tuple(cls.LOGIN_INDICATORS)
+        if cls._login_matcher is None or source != cls._login_matcher_source:
+            cls._login_matcher = build_literal_matcher(source)
+            cls._login_matcher_source = source
+            # Overlap chunks so an indicator straddling a boundary is still found
+            cls._login_chunk_overlap = max(map(len, source), default=1) - 1
+        return cls._login_matcher, cls._login_chunk_overlap
+    
     @classmethod
     def detect_login_requirement(cls, page_text: str, url: str) -> Tuple[bool, str, str]:
         """
@@ -114,14 +284,14 @@ class LoginDetector:
         Returns:
             (requires_login, platform, reason)
         """
-        page_lower = page_text.lower()
+        matcher, overlap = cls._get_login_matcher()
+        chunk_chars = cls.LOGIN_SCAN_CHUNK_CHARS
         
-        # Check for login indicators
-        login_found = False
-        for indicator in cls.LOGIN_INDICATORS:
-            if indicator in page_lower:
-                login_found = True
-                break
+        # Check for login indicators (single scan for all of them), chunk by chunk
+        login_found = any(
+            matcher(page_text[max(0, start - overlap):start + chunk_chars].lower())
+            for start in range(0, len(page_text), chunk_chars)
+        )
         
         if not login_found:
             return False, "", ""
@@ -140,6 +310,93 @@ class LoginBypassHandler:
     Handles bypassing login requirements using available strategies.
     """
     
+    # Per-platform bypass strategies, tried in order
+    BYPASS_STRATEGIES = {
+        "greenhouse": {
+            "email_only": "Look for 'Apply with email' or 'Continue as guest' button and click it",
+            "skip_login": "Look for 'Skip' or 'Apply without account' link below the login form",
+            "direct_apply": "Scroll down past the login section to find direct application form"
+        },
+        "workday": {
+            "guest_apply": "Look for 'Apply as Guest' or 'Apply without creating account' option",
+            "email_continue": "Enter email and click 'Continue' without password",
+            "skip_signin": "Look for small 'Skip sign in' link at bottom of login modal"
+        },
+        "lever": {
+            "direct_form": "Scroll down - application form is usually below the login section",
+            "guest_mode": "Look for 'Apply as guest' or similar bypass option"
+        },
+        "ashby": {
+            "no_login": "Ashby typically doesn't require login - proceed with form filling",
+            "direct_apply": "Click 'Application' tab if multiple tabs are present"
+        },
+        "smartrecruiters": {
+            "guest_apply": "Look for 'Continue as guest' or 'Apply without account' button",
+            "email_only": "Enter email and proceed without creating password"
+        },
+        "icims": {
+            "new_user": "Click 'New user? Apply now' or 'Apply without account' button",
+            "guest_option": "Look for guest application option below login form"
+        },
+        "taleo": {
+            "new_candidate": "Click 'New Candidate' or 'First time applying?' button",
+            "skip_login": "Click 'Continue as guest' or similar option"
+        },
+        "jobvite": {
+            "apply_now": "Click 'Apply Now' button which bypasses login",
+            "guest_apply": "Look for guest application option"
+        },
+        "unknown": {
+            "common_bypass": "Look for: 'Apply as guest', 'Continue without account', 'Skip login', or scroll down to find direct application form",
+            "email_only": "If only email is requested, enter it and proceed without password"
+        }
+    }
+    
+    BYPASS_PROMPT_HEAD = """
+🚫 LOGIN WALL DETECTED - BYPASS REQUIRED
+
+Platform: """
+    
+    BYPASS_PROMPT_INTRO = """
+
+CRITICAL: DO NOT CREATE AN ACCOUNT OR LOG IN!
+
+Try these strategies IN ORDER:
+
+"""
+    
+    BYPASS_PROMPT_TAIL = """
+
+BYPASS SUCCESS INDICATORS:
+✅ Application form fields are now visible (name, email, resume upload)
+✅ URL changed to /apply or /application
+✅ "Sign in" text is no longer prominently displayed
+
+BYPASS FAILURE INDICATORS:
+❌ Still showing password field as required
+❌ "Create account" is the only option (no guest/skip option)
+❌ Modal popup blocking entire page with no close button
+
+If ALL bypass attempts fail:
+- Report this as a login blocker (not your failure)
+- Return done with success=False and impossible_task=True
+"""
+    
+    # Prompt text after the platform name, per platform (filled in below)
+    _PROMPT_BODIES: Dict[str, str] = {}
+    
+    @classmethod
+    def _render_prompt_body(cls, strategies: Dict[str, str]) -> str:
+        """Render everything after the platform name for one strategy set."""
+        parts = [cls.BYPASS_PROMPT_INTRO]
+        parts.extend(
+            f"{i}. {instruction}\n"
+            for i, instruction in enumerate(strategies.values(), 1)
+        )
+        parts.append(cls.BYPASS_PROMPT_TAIL)
+        
+        return "".join(parts)
+    
     @staticmethod
     def get_bypass_strategies(platform: str) -> Dict[str, str]:
         """
@@ -151,48 +408,8 @@ class LoginBypassHandler:
         Returns:
             Dictionary of strategy instructions
         """
-        strategies = {
-            "greenhouse": {
-                "email_only": "Look for 'Apply with email' or 'Continue as guest' button and click it",
-                "skip_login": "Look for 'Skip' or 'Apply without account' link below the login form",
-                "direct_apply": "Scroll down past the login section to find direct application form"
-            },
-            "workday": {
-                "guest_apply": "Look for 'Apply as Guest' or 'Apply without creating account' option",
-                "email_continue": "Enter email and click 'Continue' without password",
-                "skip_signin": "Look for small 'Skip sign in' link at bottom of login modal"
-            },
-            "lever": {
-                "direct_form": "Scroll down - application form is usually below the login section",
-                "guest_mode": "Look for 'Apply as guest' or similar bypass option"
-            },
-            "ashby": {
-                "no_login": "Ashby typically doesn't require login - proceed with form filling",
-                "direct_apply": "Click 'Application' tab if multiple tabs are present"
-            },
-            "smartrecruiters": {
-                "guest_apply": "Look for 'Continue as guest' or 'Apply without account' button",
-                "email_only": "Enter email and proceed without creating password"
-            },
-            "icims": {
-                "new_user": "Click 'New user? Apply now' or 'Apply without account' button",
-                "guest_option": "Look for guest application option below login form"
-            },
-            "taleo": {
-                "new_candidate": "Click 'New Candidate' or 'First time applying?' button",
-                "skip_login": "Click 'Continue as guest' or similar option"
-            },
-            "jobvite": {
-                "apply_now": "Click 'Apply Now' button which bypasses login",
-                "guest_apply": "Look for guest application option"
-            },
-            "unknown": {
-                "common_bypass": "Look for: 'Apply as guest', 'Continue without account', 'Skip login', or scroll down to find direct application form",
-                "email_only": "If only email is requested, enter it and proceed without password"
-            }
-        }
-        
-        return strategies.get(platform, strategies["unknown"])
+        strategies = LoginBypassHandler.BYPASS_STRATEGIES
+        return dict(strategies.get(platform, strategies["unknown"]))
     
     @staticmethod
     def generate_bypass_prompt(platform: str, page_text: str) -> str:
@@ -206,40 +423,16 @@ class LoginBypassHandler:
         Returns:
             Bypass instruction prompt
         """
-        strategies = LoginBypassHandler.get_bypass_strategies(platform)
+        bodies = LoginBypassHandler._PROMPT_BODIES
+        body = bodies.get(platform, bodies["unknown"])
         
-        prompt = f"""
-🚫 LOGIN WALL DETECTED - BYPASS REQUIRED
-
-Platform: {platform.upper()}
+        return LoginBypassHandler.BYPASS_PROMPT_HEAD + platform.upper() + body
 
-CRITICAL: DO NOT CREATE AN ACCOUNT OR LOG IN!
 
-Try these strategies IN ORDER:
-
-"""
-        
-        for i, (strategy_name, instruction) in enumerate(strategies.items(), 1):
-            prompt += f"{i}. {instruction}\n"
-        
-        prompt += """
-
-BYPASS SUCCESS INDICATORS:
-✅ Application form fields are now visible (name, email, resume upload)
-✅ URL changed to /apply or /application
-✅ "Sign in" text is no longer prominently displayed
-
-BYPASS FAILURE INDICATORS:
-❌ Still showing password field as required
-❌ "Create account" is the only option (no guest/skip option)
-❌ Modal popup blocking entire page with no close button
-
-If ALL bypass attempts fail:
-- Report this as a login blocker (not your failure)
-- Return done with success=False and impossible_task=True
-"""
-        
-        return prompt
+LoginBypassHandler._PROMPT_BODIES = {
+    platform: LoginBypassHandler._render_prompt_body(strategies)
+    for platform, strategies in LoginBypassHandler.BYPASS_STRATEGIES.items()
+}
 
 
 class LoginHandler:
@@ -264,10 +457,10 @@ class LoginHandler:
         """
         requires_login, login_platform, reason = self.detector.detect_login_requirement(page_text, url)
         
-        # Always detect platform from URL (even if no login detected)
-        detected_platform = self.detector.detect_ats_platform(url) or ""
-        
         if not requires_login:
+            # Still report the platform from the URL; detect_login_requirement
+            # only looks it up when a login wall is found
+            detected_platform = self.detector.detect_ats_platform(url) or ""
             logger.info("✅ No login wall detected - proceeding with application")
             return False, detected_platform, ""
         
@@ -286,6 +479,10 @@ class LoginHandler:
             logger.warning(f"⚠️  Failed to bypass {platform} login - may be impossible task")
 
 
+# Shared handler for detect_and_bypass_login (the handler keeps no per-call state)
+_DEFAULT_HANDLER = LoginHandler()
+
+
 # Convenience function for quick integration
 def detect_and_bypass_login(page_text: str, url: str) -> Tuple[bool, str, str]:
     """
@@ -304,5 +501,4 @@ def detect_and_bypass_login(page_text: str, url: str) -> Tuple[bool, str, str]:
             # Inject prompt into agent instructions
             enhanced_prompt = base_prompt + "\\n\\n" + prompt
     """
-    handler = LoginHandler()
-    return handler.check_and_handle_login(page_text, url)
+    return _DEFAULT_HANDLER.check_and_handle_login(page_text, url)
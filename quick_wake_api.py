@@ -3,6 +3,11 @@
 
 import requests
 import time
+from utils import create_api_session
+
+API_URL = 'https://resume-optimizer-api-fvpd.onrender.com'
+
+session = create_api_session()
 
 print("\n🔔 Waking up Resume API...\n")
 
@@ -10,22 +15,20 @@ print("\n🔔 Waking up Resume API...\n")
 print("Attempt 1: GET / (wake up server)")
 start = time.time()
 try:
-    r = requests.get('https://resume-optimizer-api-fvpd.onrender.com', timeout=120)
+    r = session.get(API_URL, timeout=120)
     duration = time.time() - start
     print(f"✅ Server responded in {duration:.1f}s (Status: {r.status_code})")
 except Exception as e:
     print(f"❌ Failed: {e}")
 
-# Wait a bit
-print("\nWaiting 5 seconds...\n")
-time.sleep(5)
+print()
 
 # Try 2: Test the actual endpoint
 print("Attempt 2: POST /api/v1/optimize (test API)")
 start = time.time()
 try:
-    r = requests.post(
-        'https://resume-optimizer-api-fvpd.onrender.com/api/v1/optimize',
+    r = session.post(
+        f'{API_URL}/api/v1/optimize',
         json={"job_description": "Test", "return_format": "base64"},
         timeout=30
     )
@@ -39,6 +42,8 @@ try:
 except Exception as e:
     print(f"❌ Failed: {e}")
 
+session.close()
+
 print("\n" + "="*60)
 print("Resume API wake-up complete!")
 print("You can now run the batch within 10-15 minutes.")
@@ -2,55 +2,145 @@
 Split company_list.json into smaller batches of 5 jobs each.
 """
 
+import io
 import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Optional fast serializer; fall back to stdlib json
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional streaming parser; fall back to loading the whole list
+    ijson = None
+
+
+# Batch files are read by people too, so keep them indented
+if orjson is not None:
+    def _loads(data: bytes):
+        return orjson.loads(data)
+    
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    def _loads(data: bytes):
+        return json.loads(data)
+    
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+# Threads used to write batch files
+WRITE_WORKERS = 16
+
+
+def _write_batch(batch_filename: Path, batch_companies: list):
+    """
+    Serialize one batch and write it to disk (raw fd, no buffered file object).
+    
+    Writes to a per-batch temp file and renames it into place, so a crash
+    never leaves a truncated batch_XX.json behind.
+    """
+    data = memoryview(_dumps(batch_companies))
+    tmp_filename = batch_filename.with_suffix('.json.tmp')
+    fd = os.open(tmp_filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_filename, batch_filename)
+    except BaseException:
+        tmp_filename.unlink(missing_ok=True)
+        raise
+
+
+def iter_company_batches(company_list_path: Path, batch_size: int):
+    """
+    Yield lists of up to batch_size companies from the company list file.
+    
+    Streams the JSON array with ijson when it is installed, so only one
+    batch is held in memory; otherwise loads the whole list.
+    """
+    if ijson is None:
+        companies = _loads(company_list_path.read_bytes())
+        for i in range(0, len(companies), batch_size):
+            yield companies[i:i + batch_size]
+        return
+    
+    batch = []
+    with open(company_list_path, 'rb') as f:
+        for company in ijson.items(f, 'item', use_float=True):
+            batch.append(company)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
 def split_companies(batch_size=5):
     """Split company list into batches."""
     
-    # Load full company list
+    # Company list to split
     company_list_path = Path("company_list.json")
     
-    with open(company_list_path, 'r', encoding='utf-8') as f:
-        companies = json.load(f)
-    
-    total = len(companies)
-    print(f"Total jobs: {total}")
-    print(f"Batch size: {batch_size}")
-    print(f"Number of batches: {(total + batch_size - 1) // batch_size}")
-    print()
-    
     # Create batches
     batches_dir = Path("batches")
     batches_dir.mkdir(exist_ok=True)
     
-    for i in range(0, total, batch_size):
-        batch_num = (i // batch_size) + 1
-        batch_companies = companies[i:i + batch_size]
-        
-        # Save batch file
-        batch_filename = batches_dir / f"batch_{batch_num:02d}.json"
-        
-        with open(batch_filename, 'w', encoding='utf-8') as f:
-            json.dump(batch_companies, f, indent=2, ensure_ascii=False)
-        
-        print(f"✅ Created {batch_filename}")
-        print(f"   Jobs {i+1}-{min(i+batch_size, total)} ({len(batch_companies)} jobs):")
-        for company in batch_companies:
-            print(f"   - {company['name']}")
-        print()
-    
-    print("=" * 80)
-    print("✅ BATCHES CREATED")
-    print("=" * 80)
-    print()
-    print("To run batch 1:")
-    print("   python batch_apply.py --company-list batches/batch_01.json --skip-generation")
-    print()
-    print("To run batch 2:")
-    print("   python batch_apply.py --company-list batches/batch_02.json --skip-generation")
-    print()
-    print("And so on...")
+    # Save batch files concurrently as they are read (small files, so the
+    # cost is mostly I/O wait); keep only the names around for the report
+    batches = []
+    total = 0
+    with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as executor:
+        futures = []
+        for batch_num, batch_companies in enumerate(
+            iter_company_batches(company_list_path, batch_size), 1
+        ):
+            batch_filename = batches_dir / f"batch_{batch_num:02d}.json"
+            futures.append(executor.submit(_write_batch, batch_filename, batch_companies))
+            batches.append((total, batch_filename, [company['name'] for company in batch_companies]))
+            total += len(batch_companies)
+        for future in futures:
+            future.result()  # Re-raise any write error
+    
+    # Build the report in memory; it is written out in one go at the end
+    out = io.StringIO()
+    print(f"Total jobs: {total}", file=out)
+    print(f"Batch size: {batch_size}", file=out)
+    print(f"Number of batches: {len(batches)}", file=out)
+    print(file=out)
+    
+    # Report in batch order once everything is on disk
+    for i, batch_filename, company_names in batches:
+        print(f"✅ Created {batch_filename}", file=out)
+        print(f"   Jobs {i+1}-{i+len(company_names)} ({len(company_names)} jobs):", file=out)
+        for name in company_names:
+            print(f"   - {name}", file=out)
+        print(file=out)
+    
+    print("=" * 80, file=out)
+    print("✅ BATCHES CREATED", file=out)
+    print("=" * 80, file=out)
+    print(file=out)
+    print("To run batch 1:", file=out)
+    print("   python batch_apply.py --company-list batches/batch_01.json --skip-generation", file=out)
+    print(file=out)
+    print("To run batch 2:", file=out)
+    print("   python batch_apply.py --company-list batches/batch_02.json --skip-generation", file=out)
+    print(file=out)
+    print("And so on...", file=out)
+    
+    # Emit the whole report with one write instead of a write per line
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     split_companies(batch_size=5)
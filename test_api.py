@@ -1,15 +1,20 @@
 import requests
 import time
+from utils import create_api_session
+
+API_URL = 'https://resume-optimizer-api-fvpd.onrender.com'
+
+session = create_api_session()
 
 print("Testing Resume API...")
-print("URL: https://resume-optimizer-api-fvpd.onrender.com")
+print(f"URL: {API_URL}")
 print("")
 
 # Test 1: Simple GET request to wake up server
 print("Test 1: Waking up server (GET /)...")
 start = time.time()
 try:
-    r = requests.get('https://resume-optimizer-api-fvpd.onrender.com', timeout=60)
+    r = session.get(API_URL, timeout=60)
     duration = time.time() - start
     print(f'✅ API is UP! Status: {r.status_code}, Response time: {duration:.1f}s')
     if duration > 15:
@@ -31,8 +36,8 @@ try:
     }
     
     # Note: This will fail without API key, but we can see if it responds
-    r = requests.post(
-        'https://resume-optimizer-api-fvpd.onrender.com/api/v1/optimize',
+    r = session.post(
+        f'{API_URL}/api/v1/optimize',
         json=payload,
         timeout=60
     )
@@ -52,6 +57,8 @@ except requests.exceptions.Timeout:
 except Exception as e:
     print(f'❌ API ERROR: {e}')
 
+session.close()
+
 print("")
 print("=" * 60)
 print("Summary:")
@@ -11,185 +11,198 @@ Date: February 12, 2026
 from login_handler import detect_and_bypass_login, LoginHandler, LoginDetector
 from blocker_handler import check_for_blockers, BlockerType, BlockerDetector
 
+
+def _expect(condition: bool, message: str):
+    """Fail the current test (plain asserts are stripped under python -O)."""
+    if not condition:
+        raise AssertionError(message)
+
 # ═══════════════════════════════════════════════════════════════════════════
 # BLOCKER DETECTION TEST CASES
 # ═══════════════════════════════════════════════════════════════════════════
 
-def test_email_verification_blocker():
-    """Test Case 1: Email Verification Detection"""
-    print("\n🧪 Test 1: Email Verification Blocker")
-    
-    test_cases = [
-        """
+EMAIL_VERIFICATION_BLOCKER_CASES = (
+    """
         To continue, please enter the 8-character verification code 
         that was sent to your email address.
         """,
-        """
+    """
         We've sent a verification code to your email. Please check your 
         inbox and enter the code below to proceed.
         """,
-        """
+    """
         Verify your email address by entering the code we just sent you.
-        """
-    ]
+        """,
+)
+
+
+def test_email_verification_blocker():
+    """Test Case 1: Email Verification Detection"""
+    print("\n🧪 Test 1: Email Verification Blocker")
     
-    for i, page_text in enumerate(test_cases, 1):
+    for i, page_text in enumerate(EMAIL_VERIFICATION_BLOCKER_CASES, 1):
         is_blocked, blocker_type, reason, is_impossible = check_for_blockers(
             page_text, "https://example.com"
         )
         
-        assert is_blocked == True, f"Email verification #{i} not detected"
-        assert blocker_type == BlockerType.EMAIL_VERIFICATION, f"Wrong blocker type #{i}"
-        assert is_impossible == True, f"Should be impossible #{i}"
+        _expect(is_blocked == True, f"Email verification #{i} not detected")
+        _expect(blocker_type == BlockerType.EMAIL_VERIFICATION, f"Wrong blocker type #{i}")
+        _expect(is_impossible == True, f"Should be impossible #{i}")
         print(f"  ✅ Email verification variant #{i} detected correctly")
     
     print("  ✅ ALL Email verification tests passed")
 
 
+CAPTCHA_BLOCKER_CASES = (
+    "Please verify you're not a robot by completing the reCAPTCHA below.",
+    "Complete the CAPTCHA challenge to continue.",
+    "I'm not a robot checkbox required.",
+    "Verify you are human by solving the CAPTCHA.",
+)
+
+
 def test_captcha_blocker():
     """Test Case 2: CAPTCHA Detection"""
     print("\n🧪 Test 2: CAPTCHA Blocker")
     
-    test_cases = [
-        "Please verify you're not a robot by completing the reCAPTCHA below.",
-        "Complete the CAPTCHA challenge to continue.",
-        "I'm not a robot checkbox required.",
-        "Verify you are human by solving the CAPTCHA."
-    ]
-    
-    for i, page_text in enumerate(test_cases, 1):
+    for i, page_text in enumerate(CAPTCHA_BLOCKER_CASES, 1):
         is_blocked, blocker_type, reason, is_impossible = check_for_blockers(
             page_text, "https://example.com"
         )
         
-        assert is_blocked == True, f"CAPTCHA #{i} not detected"
-        assert blocker_type == BlockerType.CAPTCHA, f"Wrong blocker type #{i}"
-        assert is_impossible == True, f"Should be impossible #{i}"
+        _expect(is_blocked == True, f"CAPTCHA #{i} not detected")
+        _expect(blocker_type == BlockerType.CAPTCHA, f"Wrong blocker type #{i}")
+        _expect(is_impossible == True, f"Should be impossible #{i}")
         print(f"  ✅ CAPTCHA variant #{i} detected correctly")
     
     print("  ✅ ALL CAPTCHA tests passed")
 
 
+EXPIRED_JOB_BLOCKER_CASES = (
+    "This job has expired and is no longer accepting applications.",
+    "Sorry, this position is no longer available.",
+    "The job posting you are looking for has been removed.",
+    "This opportunity is no longer accepting applications.",
+)
+
+
 def test_expired_job_blocker():
     """Test Case 3: Expired Job Detection"""
     print("\n🧪 Test 3: Expired Job Blocker")
     
-    test_cases = [
-        "This job has expired and is no longer accepting applications.",
-        "Sorry, this position is no longer available.",
-        "The job posting you are looking for has been removed.",
-        "This opportunity is no longer accepting applications."
-    ]
-    
-    for i, page_text in enumerate(test_cases, 1):
+    for i, page_text in enumerate(EXPIRED_JOB_BLOCKER_CASES, 1):
         is_blocked, blocker_type, reason, is_impossible = check_for_blockers(
             page_text, "https://example.com"
         )
         
-        assert is_blocked == True, f"Expired job #{i} not detected"
-        assert blocker_type == BlockerType.EXPIRED_JOB, f"Wrong blocker type #{i}"
-        assert is_impossible == True, f"Should be impossible #{i}"
+        _expect(is_blocked == True, f"Expired job #{i} not detected")
+        _expect(blocker_type == BlockerType.EXPIRED_JOB, f"Wrong blocker type #{i}")
+        _expect(is_impossible == True, f"Should be impossible #{i}")
         print(f"  ✅ Expired job variant #{i} detected correctly")
     
     print("  ✅ ALL Expired job tests passed")
 
 
+PHONE_VERIFICATION_BLOCKER_CASES = (
+    "Please verify your phone number by entering the SMS code we sent you.",
+    "Enter the 6-digit code sent to your mobile phone.",
+    "Verify your phone number to continue with your application.",
+)
+
+
 def test_phone_verification_blocker():
     """Test Case 4: Phone Verification Detection"""
     print("\n🧪 Test 4: Phone Verification Blocker")
     
-    test_cases = [
-        "Please verify your phone number by entering the SMS code we sent you.",
-        "Enter the 6-digit code sent to your mobile phone.",
-        "Verify your phone number to continue with your application."
-    ]
-    
-    for i, page_text in enumerate(test_cases, 1):
+    for i, page_text in enumerate(PHONE_VERIFICATION_BLOCKER_CASES, 1):
         is_blocked, blocker_type, reason, is_impossible = check_for_blockers(
             page_text, "https://example.com"
         )
         
-        assert is_blocked == True, f"Phone verification #{i} not detected"
-        assert blocker_type == BlockerType.PHONE_VERIFICATION, f"Wrong blocker type #{i}"
-        assert is_impossible == True, f"Should be impossible #{i}"
+        _expect(is_blocked == True, f"Phone verification #{i} not detected")
+        _expect(blocker_type == BlockerType.PHONE_VERIFICATION, f"Wrong blocker type #{i}")
+        _expect(is_impossible == True, f"Should be impossible #{i}")
         print(f"  ✅ Phone verification variant #{i} detected correctly")
     
     print("  ✅ ALL Phone verification tests passed")
 
 
+VIDEO_INTERVIEW_BLOCKER_CASES = (
+    "This position requires a HireVue video interview as part of the application.",
+    "You will be asked to record video responses to interview questions.",
+    "One-way video interview required for this role.",
+)
+
+
 def test_video_interview_blocker():
     """Test Case 5: Video Interview Detection (Soft Blocker)"""
     print("\n🧪 Test 5: Video Interview Blocker (Soft)")
     
-    test_cases = [
-        "This position requires a HireVue video interview as part of the application.",
-        "You will be asked to record video responses to interview questions.",
-        "One-way video interview required for this role."
-    ]
-    
-    for i, page_text in enumerate(test_cases, 1):
+    for i, page_text in enumerate(VIDEO_INTERVIEW_BLOCKER_CASES, 1):
         is_blocked, blocker_type, reason, is_impossible = check_for_blockers(
             page_text, "https://example.com"
         )
         
-        assert is_blocked == False, f"Video interview #{i} should be soft blocker (not hard blocked)"
+        _expect(is_blocked == False, f"Video interview #{i} should be soft blocker (not hard blocked)")
         # Soft blockers don't block, they just warn
         print(f"  ✅ Video interview variant #{i} correctly identified as soft blocker")
     
     print("  ✅ ALL Video interview tests passed")
 
 
+ASSESSMENT_BLOCKER_CASES = (
+    "A coding challenge is required for this position.",
+    "You will need to complete a technical assessment as part of this application.",
+    "Skills assessment required before proceeding.",
+)
+
+
 def test_assessment_blocker():
     """Test Case 6: Assessment Detection (Soft Blocker)"""
     print("\n🧪 Test 6: Assessment Blocker (Soft)")
     
-    test_cases = [
-        "A coding challenge is required for this position.",
-        "You will need to complete a technical assessment as part of this application.",
-        "Skills assessment required before proceeding."
-    ]
-    
-    for i, page_text in enumerate(test_cases, 1):
+    for i, page_text in enumerate(ASSESSMENT_BLOCKER_CASES, 1):
         is_blocked, blocker_type, reason, is_impossible = check_for_blockers(
             page_text, "https://example.com"
         )
         
-        assert is_blocked == False, f"Assessment #{i} should be soft blocker"
+        _expect(is_blocked == False, f"Assessment #{i} should be soft blocker")
         print(f"  ✅ Assessment variant #{i} correctly identified as soft blocker")
     
     print("  ✅ ALL Assessment tests passed")
 
 
-def test_clean_page():
-    """Test Case 7: Clean Page (No Blockers)"""
-    print("\n🧪 Test 7: Clean Page (No Blockers)")
-    
-    test_cases = [
-        """
+CLEAN_PAGE_CASES = (
+    """
         Please fill out the application form below.
         First Name: ___
         Last Name: ___
         Email: ___
         Phone: ___
         """,
-        """
+    """
         Submit Your Application
         We're excited to learn more about you! Please complete all required fields.
         """,
-        """
+    """
         Application Form
         All fields marked with * are required.
-        """
-    ]
+        """,
+)
+
+
+def test_clean_page():
+    """Test Case 7: Clean Page (No Blockers)"""
+    print("\n🧪 Test 7: Clean Page (No Blockers)")
     
-    for i, page_text in enumerate(test_cases, 1):
+    for i, page_text in enumerate(CLEAN_PAGE_CASES, 1):
         is_blocked, blocker_type, reason, is_impossible = check_for_blockers(
             page_text, "https://example.com"
         )
         
-        assert is_blocked == False, f"Clean page #{i} should have no blockers"
-        assert blocker_type.value == "none", f"Should be NONE blocker type #{i}"
-        assert is_impossible == False, f"Should not be impossible #{i}"
+        _expect(is_blocked == False, f"Clean page #{i} should have no blockers")
+        _expect(blocker_type.value == "none", f"Should be NONE blocker type #{i}")
+        _expect(is_impossible == False, f"Should not be impossible #{i}")
         print(f"  ✅ Clean page #{i} correctly identified as blocker-free")
     
     print("  ✅ ALL Clean page tests passed")
@@ -199,226 +212,239 @@ def test_clean_page():
 # LOGIN DETECTION TEST CASES
 # ═══════════════════════════════════════════════════════════════════════════
 
+GREENHOUSE_LOGIN_DETECTION_CASES = (
+    {
+        "page_text": "Sign in to continue your application. Already have an account? Log in",
+        "url": "https://jobs.greenhouse.io/company/jobs/12345"
+    },
+    {
+        "page_text": "Create an account or sign in to save your progress",
+        "url": "https://job-boards.greenhouse.io/company/job"
+    },
+)
+
+
 def test_greenhouse_login_detection():
     """Test Case 8: Greenhouse Login Detection"""
     print("\n🧪 Test 8: Greenhouse Login Detection")
     
-    test_cases = [
-        {
-            "page_text": "Sign in to continue your application. Already have an account? Log in",
-            "url": "https://jobs.greenhouse.io/company/jobs/12345"
-        },
-        {
-            "page_text": "Create an account or sign in to save your progress",
-            "url": "https://job-boards.greenhouse.io/company/job"
-        }
-    ]
-    
-    for i, test_case in enumerate(test_cases, 1):
+    for i, test_case in enumerate(GREENHOUSE_LOGIN_DETECTION_CASES, 1):
         needs_bypass, platform, bypass_prompt = detect_and_bypass_login(
             test_case["page_text"], test_case["url"]
         )
         
-        assert needs_bypass == True, f"Greenhouse login #{i} not detected"
-        assert platform == "greenhouse", f"Wrong platform #{i}: {platform}"
-        assert len(bypass_prompt) > 0, f"Bypass prompt empty #{i}"
-        assert "email" in bypass_prompt.lower() or "guest" in bypass_prompt.lower(), \
-            f"Bypass prompt doesn't contain expected strategies #{i}"
+        _expect(needs_bypass == True, f"Greenhouse login #{i} not detected")
+        _expect(platform == "greenhouse", f"Wrong platform #{i}: {platform}")
+        _expect(len(bypass_prompt) > 0, f"Bypass prompt empty #{i}")
+        _expect(
+            "email" in bypass_prompt.lower() or "guest" in bypass_prompt.lower(),
+            f"Bypass prompt doesn't contain expected strategies #{i}",
+        )
         print(f"  ✅ Greenhouse variant #{i} detected with bypass strategies")
     
     print("  ✅ ALL Greenhouse tests passed")
 
 
+WORKDAY_LOGIN_DETECTION_CASES = (
+    {
+        "page_text": "Sign in to save your progress and apply faster",
+        "url": "https://company.wd5.myworkdayjobs.com/careers/job/12345"
+    },
+    {
+        "page_text": "Create Account or Sign In to continue",
+        "url": "https://example.wd1.myworkdayjobs.com/External"
+    },
+)
+
+
 def test_workday_login_detection():
     """Test Case 9: Workday Login Detection"""
     print("\n🧪 Test 9: Workday Login Detection")
     
-    test_cases = [
-        {
-            "page_text": "Sign in to save your progress and apply faster",
-            "url": "https://company.wd5.myworkdayjobs.com/careers/job/12345"
-        },
-        {
-            "page_text": "Create Account or Sign In to continue",
-            "url": "https://example.wd1.myworkdayjobs.com/External"
-        }
-    ]
-    
-    for i, test_case in enumerate(test_cases, 1):
+    for i, test_case in enumerate(WORKDAY_LOGIN_DETECTION_CASES, 1):
         needs_bypass, platform, bypass_prompt = detect_and_bypass_login(
             test_case["page_text"], test_case["url"]
         )
         
-        assert needs_bypass == True, f"Workday login #{i} not detected"
-        assert platform == "workday", f"Wrong platform #{i}: {platform}"
-        assert "guest" in bypass_prompt.lower() or "skip" in bypass_prompt.lower(), \
-            f"Bypass prompt doesn't contain expected strategies #{i}"
+        _expect(needs_bypass == True, f"Workday login #{i} not detected")
+        _expect(platform == "workday", f"Wrong platform #{i}: {platform}")
+        _expect(
+            "guest" in bypass_prompt.lower() or "skip" in bypass_prompt.lower(),
+            f"Bypass prompt doesn't contain expected strategies #{i}",
+        )
         print(f"  ✅ Workday variant #{i} detected with bypass strategies")
     
     print("  ✅ ALL Workday tests passed")
 
 
+LEVER_LOGIN_DETECTION_CASES = (
+    {
+        "page_text": "Sign in to track your application status",
+        "url": "https://jobs.lever.co/company/job-id"
+    },
+)
+
+
 def test_lever_login_detection():
     """Test Case 10: Lever Login Detection"""
     print("\n🧪 Test 10: Lever Login Detection")
     
-    test_cases = [
-        {
-            "page_text": "Sign in to track your application status",
-            "url": "https://jobs.lever.co/company/job-id"
-        }
-    ]
-    
-    for i, test_case in enumerate(test_cases, 1):
+    for i, test_case in enumerate(LEVER_LOGIN_DETECTION_CASES, 1):
         needs_bypass, platform, bypass_prompt = detect_and_bypass_login(
             test_case["page_text"], test_case["url"]
         )
         
-        assert needs_bypass == True, f"Lever login #{i} not detected"
-        assert platform == "lever", f"Wrong platform #{i}: {platform}"
+        _expect(needs_bypass == True, f"Lever login #{i} not detected")
+        _expect(platform == "lever", f"Wrong platform #{i}: {platform}")
         print(f"  ✅ Lever variant #{i} detected with bypass strategies")
     
     print("  ✅ ALL Lever tests passed")
 
 
+ICIMS_LOGIN_DETECTION_CASES = (
+    {
+        "page_text": "Please log in to your career account",
+        "url": "https://careers.company.com/jobs/12345"
+    },
+)
+
+
 def test_icims_login_detection():
     """Test Case 11: iCIMS Login Detection"""
     print("\n🧪 Test 11: iCIMS Login Detection")
     
-    test_cases = [
-        {
-            "page_text": "Please log in to your career account",
-            "url": "https://careers.company.com/jobs/12345"
-        }
-    ]
-    
-    for i, test_case in enumerate(test_cases, 1):
+    for i, test_case in enumerate(ICIMS_LOGIN_DETECTION_CASES, 1):
         needs_bypass, platform, bypass_prompt = detect_and_bypass_login(
             test_case["page_text"], test_case["url"]
         )
         
-        assert needs_bypass == True, f"iCIMS login #{i} not detected"
-        assert platform == "icims", f"Wrong platform #{i}: {platform}"
+        _expect(needs_bypass == True, f"iCIMS login #{i} not detected")
+        _expect(platform == "icims", f"Wrong platform #{i}: {platform}")
         print(f"  ✅ iCIMS variant #{i} detected with bypass strategies")
     
     print("  ✅ ALL iCIMS tests passed")
 
 
+ASHBY_LOGIN_DETECTION_CASES = (
+    {
+        "page_text": "Sign in to continue with your application",
+        "url": "https://jobs.ashbyhq.com/company/job-id"
+    },
+)
+
+
 def test_ashby_login_detection():
     """Test Case 12: Ashby Login Detection"""
     print("\n🧪 Test 12: Ashby Login Detection")
     
-    test_cases = [
-        {
-            "page_text": "Sign in to continue with your application",
-            "url": "https://jobs.ashbyhq.com/company/job-id"
-        }
-    ]
-    
-    for i, test_case in enumerate(test_cases, 1):
+    for i, test_case in enumerate(ASHBY_LOGIN_DETECTION_CASES, 1):
         needs_bypass, platform, bypass_prompt = detect_and_bypass_login(
             test_case["page_text"], test_case["url"]
         )
         
-        assert needs_bypass == True, f"Ashby login #{i} not detected"
-        assert platform == "ashby", f"Wrong platform #{i}: {platform}"
+        _expect(needs_bypass == True, f"Ashby login #{i} not detected")
+        _expect(platform == "ashby", f"Wrong platform #{i}: {platform}")
         print(f"  ✅ Ashby variant #{i} detected with bypass strategies")
     
     print("  ✅ ALL Ashby tests passed")
 
 
+SMARTRECRUITERS_LOGIN_DETECTION_CASES = (
+    {
+        "page_text": "Create an account or sign in to apply",
+        "url": "https://jobs.smartrecruiters.com/company/job-id"
+    },
+)
+
+
 def test_smartrecruiters_login_detection():
     """Test Case 13: SmartRecruiters Login Detection"""
     print("\n🧪 Test 13: SmartRecruiters Login Detection")
     
-    test_cases = [
-        {
-            "page_text": "Create an account or sign in to apply",
-            "url": "https://jobs.smartrecruiters.com/company/job-id"
-        }
-    ]
-    
-    for i, test_case in enumerate(test_cases, 1):
+    for i, test_case in enumerate(SMARTRECRUITERS_LOGIN_DETECTION_CASES, 1):
         needs_bypass, platform, bypass_prompt = detect_and_bypass_login(
             test_case["page_text"], test_case["url"]
         )
         
-        assert needs_bypass == True, f"SmartRecruiters login #{i} not detected"
-        assert platform == "smartrecruiters", f"Wrong platform #{i}: {platform}"
+        _expect(needs_bypass == True, f"SmartRecruiters login #{i} not detected")
+        _expect(platform == "smartrecruiters", f"Wrong platform #{i}: {platform}")
         print(f"  ✅ SmartRecruiters variant #{i} detected with bypass strategies")
     
     print("  ✅ ALL SmartRecruiters tests passed")
 
 
+TALEO_LOGIN_DETECTION_CASES = (
+    {
+        "page_text": "Sign in to your Taleo account",
+        "url": "https://company.taleo.net/careersection/job"
+    },
+)
+
+
 def test_taleo_login_detection():
     """Test Case 14: Taleo Login Detection"""
     print("\n🧪 Test 14: Taleo Login Detection")
     
-    test_cases = [
-        {
-            "page_text": "Sign in to your Taleo account",
-            "url": "https://company.taleo.net/careersection/job"
-        }
-    ]
-    
-    for i, test_case in enumerate(test_cases, 1):
+    for i, test_case in enumerate(TALEO_LOGIN_DETECTION_CASES, 1):
         needs_bypass, platform, bypass_prompt = detect_and_bypass_login(
             test_case["page_text"], test_case["url"]
         )
         
-        assert needs_bypass == True, f"Taleo login #{i} not detected"
-        assert platform == "taleo", f"Wrong platform #{i}: {platform}"
+        _expect(needs_bypass == True, f"Taleo login #{i} not detected")
+        _expect(platform == "taleo", f"Wrong platform #{i}: {platform}")
         print(f"  ✅ Taleo variant #{i} detected with bypass strategies")
     
     print("  ✅ ALL Taleo tests passed")
 
 
+JOBVITE_LOGIN_DETECTION_CASES = (
+    {
+        "page_text": "Sign in to your Jobvite account to continue",
+        "url": "https://jobs.jobvite.com/company/job"
+    },
+)
+
+
 def test_jobvite_login_detection():
     """Test Case 15: Jobvite Login Detection"""
     print("\n🧪 Test 15: Jobvite Login Detection")
     
-    test_cases = [
-        {
-            "page_text": "Sign in to your Jobvite account to continue",
-            "url": "https://jobs.jobvite.com/company/job"
-        }
-    ]
-    
-    for i, test_case in enumerate(test_cases, 1):
+    for i, test_case in enumerate(JOBVITE_LOGIN_DETECTION_CASES, 1):
         needs_bypass, platform, bypass_prompt = detect_and_bypass_login(
             test_case["page_text"], test_case["url"]
         )
         
-        assert needs_bypass == True, f"Jobvite login #{i} not detected"
-        assert platform == "jobvite", f"Wrong platform #{i}: {platform}"
+        _expect(needs_bypass == True, f"Jobvite login #{i} not detected")
+        _expect(platform == "jobvite", f"Wrong platform #{i}: {platform}")
         print(f"  ✅ Jobvite variant #{i} detected with bypass strategies")
     
     print("  ✅ ALL Jobvite tests passed")
 
 
+NO_LOGIN_REQUIRED_CASES = (
+    {
+        "page_text": "Please fill out the application form below. All fields are required.",
+        "url": "https://example.com/careers/apply"
+    },
+    {
+        "page_text": "Submit your application. We look forward to hearing from you!",
+        "url": "https://jobs.example.com/job/12345"
+    },
+)
+
+
 def test_no_login_required():
     """Test Case 16: No Login Required"""
     print("\n🧪 Test 16: No Login Required")
     
-    test_cases = [
-        {
-            "page_text": "Please fill out the application form below. All fields are required.",
-            "url": "https://example.com/careers/apply"
-        },
-        {
-            "page_text": "Submit your application. We look forward to hearing from you!",
-            "url": "https://jobs.example.com/job/12345"
-        }
-    ]
-    
-    for i, test_case in enumerate(test_cases, 1):
+    for i, test_case in enumerate(NO_LOGIN_REQUIRED_CASES, 1):
         needs_bypass, platform, bypass_prompt = detect_and_bypass_login(
             test_case["page_text"], test_case["url"]
         )
         
-        assert needs_bypass == False, f"False positive on clean page #{i}"
-        assert platform == "", f"Should be empty string platform #{i}, got: {platform}"
-        assert bypass_prompt == "", f"Should have empty bypass prompt #{i}"
+        _expect(needs_bypass == False, f"False positive on clean page #{i}")
+        _expect(platform == "", f"Should be empty string platform #{i}, got: {platform}")
+        _expect(bypass_prompt == "", f"Should have empty bypass prompt #{i}")
         print(f"  ✅ Clean page #{i} correctly identified as no login required")
     
     print("  ✅ ALL No Login Required tests passed")
@@ -443,15 +469,15 @@ def test_real_world_scenario():
     
     # Should detect blocker first (higher priority)
     is_blocked, blocker_type, reason, is_impossible = check_for_blockers(page_text_1, url_1)
-    assert is_blocked == True
-    assert blocker_type == BlockerType.EMAIL_VERIFICATION
-    assert is_impossible == True
+    _expect(is_blocked == True, "Scenario 1: blocker not detected")
+    _expect(blocker_type == BlockerType.EMAIL_VERIFICATION, f"Scenario 1: wrong blocker type {blocker_type}")
+    _expect(is_impossible == True, "Scenario 1: should be impossible")
     print("  ✅ Scenario 1: Email verification blocker correctly prioritized over login detection")
     
     # Should still detect login (for logging purposes)
     needs_bypass, platform, bypass_prompt = detect_and_bypass_login(page_text_1, url_1)
-    assert needs_bypass == True
-    assert platform == "greenhouse"
+    _expect(needs_bypass == True, "Scenario 1: login not detected")
+    _expect(platform == "greenhouse", f"Scenario 1: wrong platform {platform}")
     print("  ✅ Scenario 1: Login also detected but blocker takes precedence")
     
     # Scenario 2: Workday job with clean application form
@@ -468,12 +494,12 @@ def test_real_world_scenario():
     url_2 = "https://company.wd5.myworkdayjobs.com/careers/job/12345"
     
     is_blocked, blocker_type, reason, is_impossible = check_for_blockers(page_text_2, url_2)
-    assert is_blocked == False
+    _expect(is_blocked == False, "Scenario 2: clean form reported as blocked")
     print("  ✅ Scenario 2: Clean form correctly identified (no blockers)")
     
     needs_bypass, platform, bypass_prompt = detect_and_bypass_login(page_text_2, url_2)
     # Platform should be detected from URL even if no login wall in text
-    assert platform == "workday"
+    _expect(platform == "workday", f"Scenario 2: wrong platform {platform}")
     # But needs_bypass should be False since no login keywords in page text
     print(f"  ✅ Scenario 2: Platform detected as {platform}, bypass needed: {needs_bypass}")
     
@@ -484,6 +510,32 @@ def test_real_world_scenario():
 # MAIN TEST RUNNER
 # ═══════════════════════════════════════════════════════════════════════════
 
+ALL_TESTS = (
+    # Blocker tests
+    test_email_verification_blocker,
+    test_captcha_blocker,
+    test_expired_job_blocker,
+    test_phone_verification_blocker,
+    test_video_interview_blocker,
+    test_assessment_blocker,
+    test_clean_page,
+    
+    # Login detection tests
+    test_greenhouse_login_detection,
+    test_workday_login_detection,
+    test_lever_login_detection,
+    test_icims_login_detection,
+    test_ashby_login_detection,
+    test_smartrecruiters_login_detection,
+    test_taleo_login_detection,
+    test_jobvite_login_detection,
+    test_no_login_required,
+    
+    # Integration test
+    test_real_world_scenario,
+)
+
+
 def run_all_tests():
     """Run all test cases and report results."""
     print("=" * 80)
@@ -491,35 +543,10 @@ def run_all_tests():
     print("Testing: login_handler.py and blocker_handler.py")
     print("=" * 80)
     
-    tests = [
-        # Blocker tests
-        test_email_verification_blocker,
-        test_captcha_blocker,
-        test_expired_job_blocker,
-        test_phone_verification_blocker,
-        test_video_interview_blocker,
-        test_assessment_blocker,
-        test_clean_page,
-        
-        # Login detection tests
-        test_greenhouse_login_detection,
-        test_workday_login_detection,
-        test_lever_login_detection,
-        test_icims_login_detection,
-        test_ashby_login_detection,
-        test_smartrecruiters_login_detection,
-        test_taleo_login_detection,
-        test_jobvite_login_detection,
-        test_no_login_required,
-        
-        # Integration test
-        test_real_world_scenario,
-    ]
-    
     passed = 0
     failed = 0
     
-    for test_func in tests:
+    for test_func in ALL_TESTS:
         try:
             test_func()
             passed += 1
@@ -533,10 +560,10 @@ def run_all_tests():
     print("\n" + "=" * 80)
     print("TEST RESULTS")
     print("=" * 80)
-    print(f"Total Tests: {len(tests)}")
+    print(f"Total Tests: {len(ALL_TESTS)}")
     print(f"✅ Passed: {passed}")
     print(f"❌ Failed: {failed}")
-    print(f"Success Rate: {(passed/len(tests)*100):.1f}%")
+    print(f"Success Rate: {(passed/len(ALL_TESTS)*100):.1f}%")
     print("=" * 80)
     
     if failed == 0:
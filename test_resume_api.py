@@ -5,6 +5,14 @@ import requests
 import time
 from config import RESUME_API_KEY, RESUME_API_URL
 
+try:
+    import orjson
+except ImportError:  # Optional fast parser; fall back to response.json()
+    orjson = None
+
+# Keep-alive session: further calls to the API reuse the same TLS connection
+session = requests.Session()
+
 print("\n" + "="*60)
 print("TESTING RESUME GENERATION API")
 print("="*60 + "\n")
@@ -45,7 +53,7 @@ print("Calling Resume API...\n")
 start_time = time.time()
 
 try:
-    response = requests.post(
+    response = session.post(
         f'{RESUME_API_URL}/api/v1/optimize',
         headers={'X-API-Key': RESUME_API_KEY},
         json={
@@ -62,7 +70,8 @@ try:
     
     if response.status_code == 200:
         print("\n✅ SUCCESS - Resume generated!")
-        result = response.json()
+        # Payload carries base64 documents; only their lengths are reported
+        result = orjson.loads(response.content) if orjson is not None else response.json()
         
         if 'resume_base64' in result:
             resume_data = result['resume_base64']
@@ -108,4 +117,6 @@ except requests.exceptions.ConnectionError as e:
 except Exception as e:
     print(f"\n❌ ERROR: {e}")
 
+session.close()
+
 print("\n" + "="*60 + "\n")
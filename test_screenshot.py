@@ -15,6 +15,12 @@ load_dotenv()
 SCREENSHOTS_DIR = Path(__file__).parent / "logs" / "screenshots"
 SCREENSHOTS_DIR.mkdir(exist_ok=True, parents=True)
 
+# Browser attributes the screenshot methods rely on (printed in the debug dump)
+PROBED_ATTRIBUTES = (
+    'context', 'contexts', 'playwright_browser', '_playwright_browser',
+    'new_page', 'take_screenshot', 'stop', 'close',
+)
+
 async def test_screenshot_methods():
     """Test all screenshot capture methods."""
     print("=" * 80)
@@ -77,9 +83,9 @@ async def test_screenshot_methods():
                 if pages and len(pages) > 0:
                     current_page = pages[-1]
                     screenshot_path = SCREENSHOTS_DIR / f"method1_{timestamp}.png"
-                    await current_page.screenshot(path=str(screenshot_path), full_page=True)
+                    png_bytes = await current_page.screenshot(path=str(screenshot_path), full_page=True)
                     print(f"✅ SUCCESS: {screenshot_path}")
-                    print(f"   File size: {screenshot_path.stat().st_size} bytes")
+                    print(f"   File size: {len(png_bytes)} bytes")
                 else:
                     print("❌ FAILED: No pages found")
             else:
@@ -100,9 +106,9 @@ async def test_screenshot_methods():
                 if pages and len(pages) > 0:
                     current_page = pages[-1]
                     screenshot_path = SCREENSHOTS_DIR / f"method2_{timestamp}.png"
-                    await current_page.screenshot(path=str(screenshot_path), full_page=True)
+                    png_bytes = await current_page.screenshot(path=str(screenshot_path), full_page=True)
                     print(f"✅ SUCCESS: {screenshot_path}")
-                    print(f"   File size: {screenshot_path.stat().st_size} bytes")
+                    print(f"   File size: {len(png_bytes)} bytes")
                 else:
                     print("❌ FAILED: No pages in context")
             else:
@@ -122,9 +128,9 @@ async def test_screenshot_methods():
                 if pages and len(pages) > 0:
                     current_page = pages[-1]
                     screenshot_path = SCREENSHOTS_DIR / f"method3_{timestamp}.png"
-                    await current_page.screenshot(path=str(screenshot_path), full_page=True)
+                    png_bytes = await current_page.screenshot(path=str(screenshot_path), full_page=True)
                     print(f"✅ SUCCESS: {screenshot_path}")
-                    print(f"   File size: {screenshot_path.stat().st_size} bytes")
+                    print(f"   File size: {len(png_bytes)} bytes")
                 else:
                     print("❌ FAILED: No pages found")
             else:
@@ -147,9 +153,9 @@ async def test_screenshot_methods():
                     if pages and len(pages) > 0:
                         current_page = pages[-1]
                         screenshot_path = SCREENSHOTS_DIR / f"method4_{timestamp}.png"
-                        await current_page.screenshot(path=str(screenshot_path), full_page=True)
+                        png_bytes = await current_page.screenshot(path=str(screenshot_path), full_page=True)
                         print(f"✅ SUCCESS: {screenshot_path}")
-                        print(f"   File size: {screenshot_path.stat().st_size} bytes")
+                        print(f"   File size: {len(png_bytes)} bytes")
                     else:
                         print("❌ FAILED: No pages found")
                 else:
@@ -168,11 +174,15 @@ async def test_screenshot_methods():
     print("=" * 80)
     print()
     print(f"browser type: {type(browser)}")
-    print(f"browser attributes: {dir(browser)}")
+    print("browser attributes:")
+    for attr in PROBED_ATTRIBUTES:
+        print(f"  {attr}: {getattr(browser, attr, '<missing>')!r:.80}")
     print()
     if hasattr(agent, 'browser'):
         print(f"agent.browser type: {type(agent.browser)}")
-        print(f"agent.browser attributes: {dir(agent.browser)}")
+        print("agent.browser attributes:")
+        for attr in PROBED_ATTRIBUTES:
+            print(f"  {attr}: {getattr(agent.browser, attr, '<missing>')!r:.80}")
     print()
     
     # Close browser
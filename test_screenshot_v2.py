@@ -91,7 +91,7 @@ async def test_screenshot_methods():
             with open(screenshot_path, 'wb') as f:
                 f.write(screenshot_bytes)
             print(f"✅ SUCCESS: {screenshot_path}")
-            print(f"   File size: {screenshot_path.stat().st_size} bytes")
+            print(f"   File size: {len(screenshot_bytes)} bytes")
         else:
             print("❌ FAILED: take_screenshot() returned no data")
     except Exception as e:
@@ -117,9 +117,9 @@ async def test_screenshot_methods():
         
         if current_page:
             screenshot_path = SCREENSHOTS_DIR / f"method3_pw_contexts_{timestamp}.png"
-            await current_page.screenshot(path=str(screenshot_path), full_page=True)
+            png_bytes = await current_page.screenshot(path=str(screenshot_path), full_page=True)
             print(f"✅ SUCCESS: {screenshot_path}")
-            print(f"   File size: {screenshot_path.stat().st_size} bytes")
+            print(f"   File size: {len(png_bytes)} bytes")
         else:
             print("❌ FAILED: Could not access playwright browser contexts")
     except Exception as e:
@@ -140,10 +140,15 @@ async def test_screenshot_methods():
     # Summary
     print("📊 SUMMARY:")
     print("Check the logs/screenshots/ directory for generated screenshots")
-    screenshots = list(SCREENSHOTS_DIR.glob(f"*{timestamp}*.png"))
+    # One directory pass; same files as glob(f"*{timestamp}*.png"), which skips dotfiles
+    with os.scandir(SCREENSHOTS_DIR) as entries:
+        screenshots = [
+            (entry.name, entry.stat().st_size) for entry in entries
+            if timestamp in entry.name and entry.name.endswith('.png') and not entry.name.startswith('.')
+        ]
     print(f"Screenshots found: {len(screenshots)}")
-    for ss in screenshots:
-        print(f"  - {ss.name} ({ss.stat().st_size} bytes)")
+    if screenshots:
+        print("\n".join(f"  - {name} ({size} bytes)" for name, size in screenshots))
 
 if __name__ == "__main__":
     asyncio.run(test_screenshot_methods())
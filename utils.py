@@ -12,17 +12,37 @@ Date: February 11, 2026
 
 import json
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
 import re
 
+try:
+    import orjson
+except ImportError:  # Optional fast parser/serializer; fall back to stdlib json
+    orjson = None
+
 logger = logging.getLogger("JobAutomation.Utils")
 
 # ═══════════════════════════════════════════════════════════════════════════
 # FILE OPERATIONS
 # ═══════════════════════════════════════════════════════════════════════════
 
+# JSON file encoding (orjson when installed); both produce indented UTF-8
+if orjson is not None:
+    def _loads(data: bytes):
+        return orjson.loads(data)
+    
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+else:
+    def _loads(data: bytes):
+        return json.loads(data)
+    
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
 def load_json_file(file_path: Path) -> Dict:
     """
     Load and parse a JSON file.
@@ -34,12 +54,12 @@ def load_json_file(file_path: Path) -> Dict:
         Parsed JSON data as dictionary
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(file_path, 'rb') as f:
+            return _loads(f.read())
     except FileNotFoundError:
         logger.error(f"File not found: {file_path}")
         raise
-    except json.JSONDecodeError as e:
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses it
         logger.error(f"Invalid JSON in {file_path}: {e}")
         raise
 
@@ -52,8 +72,9 @@ def save_json_file(data: Dict, file_path: Path):
         file_path: Path to save to
     """
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        encoded = _dumps(data)
+        with open(file_path, 'wb') as f:
+            f.write(encoded)
         logger.info(f"Saved JSON to {file_path}")
     except Exception as e:
         logger.error(f"Failed to save JSON to {file_path}: {e}")
@@ -110,6 +131,23 @@ def extract_contact_info(user_profile: Dict) -> Dict:
 # TEXT PROCESSING
 # ═══════════════════════════════════════════════════════════════════════════
 
+# Extraction patterns, compiled once at import instead of going through
+# re's cache on every call
+
+# Common patterns for company names in job postings
+_COMPANY_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'Company:\s*([A-Z][A-Za-z\s&.]+)',
+    r'at\s+([A-Z][A-Za-z\s&.]+)\s+is',
+    r'([A-Z][A-Za-z\s&.]+)\s+is\s+hiring',
+))
+
+# Common patterns for job titles
+_TITLE_PATTERNS = tuple(re.compile(pattern, re.MULTILINE) for pattern in (
+    r'Job Title:\s*([A-Za-z\s-]+)',
+    r'Position:\s*([A-Za-z\s-]+)',
+    r'^([A-Za-z\s-]+)\s*-\s*Job',
+))
+
 def clean_text(text: str) -> str:
     """
     Clean and normalize text.
@@ -120,11 +158,9 @@ def clean_text(text: str) -> str:
     Returns:
         Cleaned text
     """
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-    # Remove leading/trailing whitespace
-    text = text.strip()
-    return text
+    # str.split() breaks on exactly the characters \s matches and drops
+    # leading/trailing runs, so this equals re.sub(r'\s+', ' ', text).strip()
+    return ' '.join(text.split())
 
 def extract_company_name(job_description: str) -> Optional[str]:
     """
@@ -136,15 +172,8 @@ def extract_company_name(job_description: str) -> Optional[str]:
     Returns:
         Company name if found, None otherwise
     """
-    # Common patterns for company names in job postings
-    patterns = [
-        r'Company:\s*([A-Z][A-Za-z\s&.]+)',
-        r'at\s+([A-Z][A-Za-z\s&.]+)\s+is',
-        r'([A-Z][A-Za-z\s&.]+)\s+is\s+hiring',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, job_description)
+    for pattern in _COMPANY_PATTERNS:
+        match = pattern.search(job_description)
         if match:
             return match.group(1).strip()
     
@@ -160,15 +189,8 @@ def extract_job_title(job_description: str) -> Optional[str]:
     Returns:
         Job title if found, None otherwise
     """
-    # Common patterns for job titles
-    patterns = [
-        r'Job Title:\s*([A-Za-z\s-]+)',
-        r'Position:\s*([A-Za-z\s-]+)',
-        r'^([A-Za-z\s-]+)\s*-\s*Job',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, job_description, re.MULTILINE)
+    for pattern in _TITLE_PATTERNS:
+        match = pattern.search(job_description)
         if match:
             return match.group(1).strip()
     
@@ -178,18 +200,41 @@ def extract_job_title(job_description: str) -> Optional[str]:
 # DATE/TIME HELPERS
 # ═══════════════════════════════════════════════════════════════════════════
 
+# Last formatted second per format string; both formats have one-second
+# resolution, so strftime only needs to run when the clock ticks over
+_timestamp_cache: Dict[str, tuple] = {}
+
+def _format_current_second(fmt: str) -> str:
+    """Format the current local time with `fmt`, reusing the last result within a second."""
+    now = int(time.time())
+    cached = _timestamp_cache.get(fmt)
+    if cached is None or cached[0] != now:
+        cached = (now, time.strftime(fmt, time.localtime(now)))
+        _timestamp_cache[fmt] = cached
+    return cached[1]
+
 def get_timestamp_string() -> str:
     """Get current timestamp as formatted string."""
-    return datetime.now().strftime("%Y%m%d_%H%M%S")
+    return _format_current_second("%Y%m%d_%H%M%S")
 
 def get_readable_timestamp() -> str:
     """Get current timestamp in human-readable format."""
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return _format_current_second("%Y-%m-%d %H:%M:%S")
 
 # ═══════════════════════════════════════════════════════════════════════════
 # VALIDATION HELPERS
 # ═══════════════════════════════════════════════════════════════════════════
 
+_URL_RE = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
+    r'localhost|'  # localhost
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # IP
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 def is_valid_url(url: str) -> bool:
     """
     Check if string is a valid URL.
@@ -200,15 +245,7 @@ def is_valid_url(url: str) -> bool:
     Returns:
         True if valid URL, False otherwise
     """
-    url_pattern = re.compile(
-        r'^https?://'  # http:// or https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
-        r'localhost|'  # localhost
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # IP
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-    
-    return bool(url_pattern.match(url))
+    return bool(_URL_RE.match(url))
 
 def is_valid_email(email: str) -> bool:
     """
@@ -220,8 +257,39 @@ def is_valid_email(email: str) -> bool:
     Returns:
         True if valid email, False otherwise
     """
-    email_pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
-    return bool(email_pattern.match(email))
+    return bool(_EMAIL_RE.match(email))
+
+# ═══════════════════════════════════════════════════════════════════════════
+# HTTP HELPERS
+# ═══════════════════════════════════════════════════════════════════════════
+
+def create_api_session():
+    """
+    Create a keep-alive requests.Session for calls to the Resume API.
+
+    Consecutive calls reuse one TLS connection. Connection errors are retried
+    with backoff, and so are 502/503/504 responses from a waking server, but
+    only for idempotent methods (urllib3's default) so a resume-generation
+    POST is never sent twice.
+
+    Returns:
+        Configured requests.Session
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=4,
+        max_retries=Retry(
+            total=3, read=0, backoff_factor=1,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False
+        )
+    ))
+    return session
 
 # ═══════════════════════════════════════════════════════════════════════════
 # LOGGING HELPERS
@@ -238,8 +306,11 @@ def log_section_header(title: str, logger_instance: logging.Logger = None):
     if logger_instance is None:
         logger_instance = logger
     
+    if not logger_instance.isEnabledFor(logging.INFO):
+        return
+    
     logger_instance.info("=" * 80)
-    logger_instance.info(title)
+    logger_instance.info("%s", title)
     logger_instance.info("=" * 80)
 
 def log_step(step_number: int, description: str, logger_instance: logging.Logger = None):
@@ -254,7 +325,7 @@ def log_step(step_number: int, description: str, logger_instance: logging.Logger
     if logger_instance is None:
         logger_instance = logger
     
-    logger_instance.info(f"STEP {step_number}: {description}")
+    logger_instance.info("STEP %s: %s", step_number, description)
 
 def log_success(message: str, logger_instance: logging.Logger = None):
     """
@@ -267,7 +338,7 @@ def log_success(message: str, logger_instance: logging.Logger = None):
     if logger_instance is None:
         logger_instance = logger
     
-    logger_instance.info(f"✅ {message}")
+    logger_instance.info("✅ %s", message)
 
 def log_error(message: str, logger_instance: logging.Logger = None):
     """
@@ -280,7 +351,7 @@ def log_error(message: str, logger_instance: logging.Logger = None):
     if logger_instance is None:
         logger_instance = logger
     
-    logger_instance.error(f"❌ {message}")
+    logger_instance.error("❌ %s", message)
 
 def log_warning(message: str, logger_instance: logging.Logger = None):
     """
@@ -293,7 +364,7 @@ def log_warning(message: str, logger_instance: logging.Logger = None):
     if logger_instance is None:
         logger_instance = logger
     
-    logger_instance.warning(f"⚠️  {message}")
+    logger_instance.warning("⚠️  %s", message)
 
 # ═══════════════════════════════════════════════════════════════════════════
 # FILE SIZE HELPERS
@@ -325,10 +396,11 @@ def get_file_size(file_path: Path) -> str:
     Returns:
         Human-readable file size
     """
-    if not file_path.exists():
+    try:
+        size_bytes = file_path.stat().st_size
+    except (FileNotFoundError, NotADirectoryError):  # What Path.exists() treated as missing
         return "File not found"
     
-    size_bytes = file_path.stat().st_size
     return human_readable_size(size_bytes)
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -338,6 +410,8 @@ def get_file_size(file_path: Path) -> str:
 class ProgressTracker:
     """Simple progress tracker for multi-step operations."""
     
+    __slots__ = ('total_steps', 'current_step', 'logger', 'start_time')
+    
     def __init__(self, total_steps: int, logger_instance: logging.Logger = None):
         """
         Initialize progress tracker.
@@ -349,7 +423,7 @@ class ProgressTracker:
         self.total_steps = total_steps
         self.current_step = 0
         self.logger = logger_instance or logger
-        self.start_time = datetime.now()
+        self.start_time = time.monotonic()  # Immune to wall-clock jumps
     
     def next_step(self, step_name: str):
         """
@@ -359,11 +433,13 @@ class ProgressTracker:
             step_name: Name of the step
         """
         self.current_step += 1
-        progress = (self.current_step / self.total_steps) * 100
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         
-        self.logger.info(f"[{self.current_step}/{self.total_steps}] ({progress:.0f}%) {step_name}")
+        progress = (self.current_step / self.total_steps) * 100
+        self.logger.info("[%s/%s] (%.0f%%) %s", self.current_step, self.total_steps, progress, step_name)
     
     def complete(self):
         """Mark all steps as complete."""
-        elapsed = datetime.now() - self.start_time
-        self.logger.info(f"✅ All {self.total_steps} steps completed in {elapsed}")
+        elapsed = timedelta(seconds=time.monotonic() - self.start_time)
+        self.logger.info("✅ All %s steps completed in %s", self.total_steps, elapsed)
@@ -11,226 +11,353 @@ Date: February 11, 2026
 ═══════════════════════════════════════════════════════════════════════════════
 """
 
+import os
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
-print("═" * 80)
-print("JOB APPLICATION AUTOMATION - ENVIRONMENT VERIFICATION")
-print("═" * 80)
-print()
+try:
+    import orjson
+except ImportError:  # Optional fast parser; fall back to stdlib json
+    orjson = None
 
-# Track issues
-issues = []
-warnings = []
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Banner line for the header and summary
+SEPARATOR = "═" * 80
+
+# Each check appends its report lines, issues and warnings to the lists it is given
 
 # ═══════════════════════════════════════════════════════════════════════════
 # 1. Check Python Version
 # ═══════════════════════════════════════════════════════════════════════════
 
-print("1. Checking Python version...")
-python_version = sys.version_info
-if python_version.major >= 3 and python_version.minor >= 9:
-    print(f"   ✅ Python {python_version.major}.{python_version.minor}.{python_version.micro}")
-else:
-    print(f"   ❌ Python {python_version.major}.{python_version.minor}.{python_version.micro} (need 3.9+)")
-    issues.append("Python version too old (need 3.9+)")
+def check_python_version(lines: List[str], issues: List[str], warnings: List[str]):
+    """Check the interpreter is Python 3.9+."""
+    lines.append("1. Checking Python version...")
+    python_version = sys.version_info
+    if python_version.major >= 3 and python_version.minor >= 9:
+        lines.append(f"   ✅ Python {python_version.major}.{python_version.minor}.{python_version.micro}")
+    else:
+        lines.append(f"   ❌ Python {python_version.major}.{python_version.minor}.{python_version.micro} (need 3.9+)")
+        issues.append("Python version too old (need 3.9+)")
 
 # ═══════════════════════════════════════════════════════════════════════════
 # 2. Check Required Packages
 # ═══════════════════════════════════════════════════════════════════════════
 
-print("2. Checking required packages...")
-required_packages = [
-    "browser_use",
-    "playwright",
-    "requests",
-    "langchain",
-]
-
-for package in required_packages:
-    try:
-        __import__(package.replace("-", "_"))
-        print(f"   ✅ {package} installed")
-    except ImportError:
-        print(f"   ❌ {package} NOT installed")
-        issues.append(f"Package '{package}' not installed")
+def check_required_packages(lines: List[str], issues: List[str], warnings: List[str]):
+    """Check the core packages are installed."""
+    lines.append("2. Checking required packages...")
+    required_packages = [
+        "browser_use",
+        "playwright",
+        "requests",
+        "langchain",
+    ]
+
+    # find_spec only locates the package; importing langchain or browser_use
+    # would run their whole (seconds-long) initialization just to check
+    for package in required_packages:
+        if find_spec(package.replace("-", "_")) is not None:
+            lines.append(f"   ✅ {package} installed")
+        else:
+            lines.append(f"   ❌ {package} NOT installed")
+            issues.append(f"Package '{package}' not installed")
 
 # ═══════════════════════════════════════════════════════════════════════════
 # 3. Check Configuration Files
 # ═══════════════════════════════════════════════════════════════════════════
 
-print("3. Checking configuration files...")
-
-# Check user_profile.json
-user_profile_path = Path("user_profile.json")
-if user_profile_path.exists():
-    print(f"   ✅ user_profile.json exists")
+@lru_cache(maxsize=None)
+def working_directory_entries() -> Dict[str, os.DirEntry]:
+    """One os.scandir() of the working directory, shared by every existence check."""
+    with os.scandir('.') as entries:
+        return {entry.name: entry for entry in entries}
+
+def path_exists(name: str) -> bool:
+    """Path(name).exists() for a top-level name, answered from the directory listing."""
+    entry = working_directory_entries().get(name)
+    if entry is None:
+        # Not listed under this exact name (could still exist on a case-insensitive filesystem)
+        return os.path.exists(name)
+    # Listed entries exist; a symlink only counts if its target does
+    return not entry.is_symlink() or os.path.exists(entry.path)
+
+def load_user_profile(path: Path) -> Tuple[Optional[Dict], Optional[str]]:
+    """
+    Read and parse the user profile, naming the way it is broken if it is.
     
-    # Validate JSON
+    Returns:
+        (profile, problem): problem is None when the profile parsed, else a
+        short description such as "is empty" or "is a directory, not a file"
+    """
     try:
-        with open(user_profile_path, 'r', encoding='utf-8') as f:
-            profile = json.load(f)
-        
-        # Check required fields
-        personal_info = profile.get("personal_info", {})
-        if not personal_info.get("full_name"):
-            warnings.append("user_profile.json: full_name is empty")
-        if not personal_info.get("email"):
-            warnings.append("user_profile.json: email is empty")
-        if not personal_info.get("phone"):
-            warnings.append("user_profile.json: phone is empty")
-        
-        print(f"   ✅ user_profile.json is valid JSON")
-        print(f"      Name: {personal_info.get('full_name', 'NOT SET')}")
-        print(f"      Email: {personal_info.get('email', 'NOT SET')}")
-        
-    except json.JSONDecodeError:
-        print(f"   ❌ user_profile.json has invalid JSON")
-        issues.append("user_profile.json contains invalid JSON")
-        
-else:
-    print(f"   ❌ user_profile.json NOT found")
-    issues.append("user_profile.json file missing")
+        raw = path.read_bytes()
+    except IsADirectoryError:
+        return None, "is a directory, not a file"
+    except OSError as e:
+        return None, f"cannot be read ({e.strerror})"
+    
+    if not raw.strip():
+        return None, "is empty"
+    if b'\x00' in raw:
+        return None, "is a binary file, not JSON text"
+    
+    try:
+        return _json_loads(raw.decode('utf-8')), None
+    except UnicodeDecodeError:
+        return None, "is not UTF-8 text"
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses it
+        return None, f"has invalid JSON (line {e.lineno}, column {e.colno}: {e.msg})"
+
+def check_configuration_files(lines: List[str], issues: List[str], warnings: List[str]):
+    """Check user_profile.json (valid JSON, key fields) and config.py exist."""
+    lines.append("3. Checking configuration files...")
+
+    # Check user_profile.json
+    if path_exists("user_profile.json"):
+        lines.append(f"   ✅ user_profile.json exists")
+
+        # Validate JSON
+        profile, problem = load_user_profile(Path("user_profile.json"))
+        if problem is None:
+            # Check required fields
+            personal_info = profile.get("personal_info", {})
+            if not personal_info.get("full_name"):
+                warnings.append("user_profile.json: full_name is empty")
+            if not personal_info.get("email"):
+                warnings.append("user_profile.json: email is empty")
+            if not personal_info.get("phone"):
+                warnings.append("user_profile.json: phone is empty")
+
+            lines.append(f"   ✅ user_profile.json is valid JSON")
+            lines.append(f"      Name: {personal_info.get('full_name', 'NOT SET')}")
+            lines.append(f"      Email: {personal_info.get('email', 'NOT SET')}")
+        else:
+            lines.append(f"   ❌ user_profile.json {problem}")
+            issues.append(f"user_profile.json {problem}")
 
-# Check config.py
-config_path = Path("config.py")
-if config_path.exists():
-    print(f"   ✅ config.py exists")
-else:
-    print(f"   ❌ config.py NOT found")
-    issues.append("config.py file missing")
+    else:
+        lines.append(f"   ❌ user_profile.json NOT found")
+        issues.append("user_profile.json file missing")
+
+    # Check config.py
+    if path_exists("config.py"):
+        lines.append(f"   ✅ config.py exists")
+    else:
+        lines.append(f"   ❌ config.py NOT found")
+        issues.append("config.py file missing")
 
 # ═══════════════════════════════════════════════════════════════════════════
 # 4. Check API Keys
 # ═══════════════════════════════════════════════════════════════════════════
 
-print("4. Checking API configuration...")
+def resume_api_key_configured() -> bool:
+    """True if config.py imports and sets a real (non-placeholder) RESUME_API_KEY."""
+    try:
+        import config
+    except ImportError:
+        return False
+    return bool(config.RESUME_API_KEY) and config.RESUME_API_KEY != "YOUR_API_KEY_HERE"
 
-try:
-    import config
-    
-    if config.RESUME_API_KEY and config.RESUME_API_KEY != "YOUR_API_KEY_HERE":
-        print(f"   ✅ Resume API key configured")
-    else:
-        print(f"   ❌ Resume API key NOT configured")
-        issues.append("Resume API key not set in config.py")
-    
-    if config.GEMINI_API_KEY and config.GEMINI_API_KEY != "YOUR_GEMINI_KEY_HERE":
-        print(f"   ✅ Gemini API key configured")
-    else:
-        print(f"   ❌ Gemini API key NOT configured")
-        issues.append("Gemini API key not set in config.py")
-        
-except ImportError:
-    print(f"   ❌ Cannot import config.py")
-    issues.append("config.py cannot be imported")
+def check_api_keys(lines: List[str], issues: List[str], warnings: List[str]):
+    """Check the Resume and Gemini API keys are set in config.py."""
+    lines.append("4. Checking API configuration...")
+
+    try:
+        import config
+
+        if resume_api_key_configured():
+            lines.append(f"   ✅ Resume API key configured")
+        else:
+            lines.append(f"   ❌ Resume API key NOT configured")
+            issues.append("Resume API key not set in config.py")
+
+        if config.GEMINI_API_KEY and config.GEMINI_API_KEY != "YOUR_GEMINI_KEY_HERE":
+            lines.append(f"   ✅ Gemini API key configured")
+        else:
+            lines.append(f"   ❌ Gemini API key NOT configured")
+            issues.append("Gemini API key not set in config.py")
+
+    except ImportError:
+        lines.append(f"   ❌ Cannot import config.py")
+        issues.append("config.py cannot be imported")
 
 # ═══════════════════════════════════════════════════════════════════════════
 # 5. Check Directories
 # ═══════════════════════════════════════════════════════════════════════════
 
-print("5. Checking directories...")
+def check_directories(lines: List[str], issues: List[str], warnings: List[str]):
+    """Check the output directories exist."""
+    lines.append("5. Checking directories...")
 
-directories = [
-    "generated_documents",
-    "logs"
-]
+    directories = [
+        "generated_documents",
+        "logs"
+    ]
 
-for dir_name in directories:
-    dir_path = Path(dir_name)
-    if dir_path.exists():
-        print(f"   ✅ {dir_name}/ exists")
-    else:
-        print(f"   ⚠️  {dir_name}/ NOT found (will be created automatically)")
-        warnings.append(f"{dir_name}/ directory will be auto-created")
+    for dir_name in directories:
+        if path_exists(dir_name):
+            lines.append(f"   ✅ {dir_name}/ exists")
+        else:
+            lines.append(f"   ⚠️  {dir_name}/ NOT found (will be created automatically)")
+            warnings.append(f"{dir_name}/ directory will be auto-created")
 
 # ═══════════════════════════════════════════════════════════════════════════
 # 6. Test API Connection (Optional)
 # ═══════════════════════════════════════════════════════════════════════════
 
-print("6. Testing API connectivity...")
+def check_api_connectivity(lines: List[str], issues: List[str], warnings: List[str]):
+    """Check the Resume API answers its health endpoint."""
+    lines.append("6. Testing API connectivity...")
+
+    # Without a key the automation cannot use the API anyway (step 4 reports
+    # that), so don't spend up to two minutes waking it
+    if not resume_api_key_configured():
+        lines.append(f"   ⏭️  Skipping Resume API test (API key not configured)")
+        return
 
-try:
-    import requests
-    
-    # Test Resume API health
     try:
-        print(f"   ⏳ Testing Resume API (may take up to 120 seconds on cold start)...")
-        response = requests.get(
-            "https://resume-optimizer-api-fvpd.onrender.com/health",
-            timeout=120
-        )
-        if response.status_code == 200:
-            print(f"   ✅ Resume API is reachable")
-        else:
-            print(f"   ⚠️  Resume API returned status {response.status_code}")
-            warnings.append("Resume API might be having issues")
-    except requests.exceptions.RequestException as e:
-        print(f"   ⚠️  Cannot reach Resume API: {str(e)}")
-        warnings.append("Resume API connection failed (check internet or cold start timeout)")
-        
-except ImportError:
-    print(f"   ⚠️  Cannot test API (requests not installed)")
+        import requests
+
+        # Test Resume API health (the wait notice is printed up front, see below)
+        try:
+            # Fail fast if the host is unreachable; only the response may be slow
+            response = requests.get(
+                "https://resume-optimizer-api-fvpd.onrender.com/health",
+                timeout=(5, 120)
+            )
+            if response.status_code == 200:
+                lines.append(f"   ✅ Resume API is reachable")
+            else:
+                lines.append(f"   ⚠️  Resume API returned status {response.status_code}")
+                warnings.append("Resume API might be having issues")
+        except requests.exceptions.RequestException as e:
+            lines.append(f"   ⚠️  Cannot reach Resume API: {str(e)}")
+            warnings.append("Resume API connection failed (check internet or cold start timeout)")
+
+    except ImportError:
+        lines.append(f"   ⚠️  Cannot test API (requests not installed)")
 
 # ═══════════════════════════════════════════════════════════════════════════
 # 7. Check Playwright
 # ═══════════════════════════════════════════════════════════════════════════
 
-print("7. Checking Playwright browsers...")
+def check_playwright(lines: List[str], issues: List[str], warnings: List[str]):
+    """Check Playwright's Chromium build is installed."""
+    lines.append("7. Checking Playwright browsers...")
 
-try:
-    from playwright.sync_api import sync_playwright
-    
-    with sync_playwright() as p:
-        try:
-            browser = p.chromium.launch(headless=True)
-            browser.close()
-            print(f"   ✅ Playwright browsers installed")
-        except Exception as e:
-            print(f"   ❌ Playwright browsers NOT installed")
+    try:
+        from playwright.sync_api import sync_playwright
+
+        # The Chromium build only has to be present; launching it would fork a
+        # browser (seconds, hundreds of MB) just to close it again
+        with sync_playwright() as p:
+            chromium_path = Path(p.chromium.executable_path)
+
+        if chromium_path.is_file() and os.access(chromium_path, os.X_OK):
+            lines.append(f"   ✅ Playwright browsers installed")
+        else:
+            lines.append(f"   ❌ Playwright browsers NOT installed")
             issues.append("Run: playwright install")
-            
-except Exception as e:
-    print(f"   ⚠️  Cannot check Playwright: {str(e)}")
-    warnings.append("Playwright check failed")
+
+    except Exception as e:
+        lines.append(f"   ⚠️  Cannot check Playwright: {str(e)}")
+        warnings.append("Playwright check failed")
+
+# ═══════════════════════════════════════════════════════════════════════════
+# RUN CHECKS
+# ═══════════════════════════════════════════════════════════════════════════
+
+# The checks are independent, so they all run at once: the script takes as
+# long as the slowest one (the API probe or the browser launch), not the sum
+CHECKS = (
+    check_python_version,
+    check_required_packages,
+    check_configuration_files,
+    check_api_keys,
+    check_directories,
+    check_api_connectivity,
+    check_playwright,
+)
+
+def run_check(check):
+    """Run one check with its own output, issue and warning lists."""
+    lines, check_issues, check_warnings = [], [], []
+    check(lines, check_issues, check_warnings)
+    return lines, check_issues, check_warnings
+
+print("\n".join([
+    SEPARATOR,
+    "JOB APPLICATION AUTOMATION - ENVIRONMENT VERIFICATION",
+    SEPARATOR,
+    "",
+]))
+
+# Track issues
+issues = []
+warnings = []
+
+with ThreadPoolExecutor(max_workers=len(CHECKS)) as executor:
+    futures = [executor.submit(run_check, check) for check in CHECKS]
+
+    # Step reports are buffered until their check finishes, so say now that
+    # the API probe may hold up the output instead of after the wait
+    if resume_api_key_configured():
+        print("⏳ Testing Resume API in the background (may take up to 120 seconds on cold start)...\n")
+
+    # Report in step order, each step as soon as it (and those before it) finish
+    for future in futures:
+        lines, check_issues, check_warnings = future.result()
+        print("\n".join(lines))
+        issues.extend(check_issues)
+        warnings.extend(check_warnings)
 
 # ═══════════════════════════════════════════════════════════════════════════
 # SUMMARY
 # ═══════════════════════════════════════════════════════════════════════════
 
-print()
-print("═" * 80)
-print("VERIFICATION SUMMARY")
-print("═" * 80)
+# Build the whole summary, then print it in one write
+summary = [
+    "",
+    SEPARATOR,
+    "VERIFICATION SUMMARY",
+    SEPARATOR,
+]
 
 if not issues and not warnings:
-    print("✅ ALL CHECKS PASSED!")
-    print()
-    print("Your environment is ready to run job application automation.")
-    print()
-    print("Next steps:")
-    print("  1. Update user_profile.json with your information")
-    print("  2. Set JOB_URL in job_application_automation.py")
-    print("  3. Run: python job_application_automation.py")
+    summary.append("✅ ALL CHECKS PASSED!")
+    summary.append("")
+    summary.append("Your environment is ready to run job application automation.")
+    summary.append("")
+    summary.append("Next steps:")
+    summary.append("  1. Update user_profile.json with your information")
+    summary.append("  2. Set JOB_URL in job_application_automation.py")
+    summary.append("  3. Run: python job_application_automation.py")
     
 elif issues:
-    print("❌ CRITICAL ISSUES FOUND:")
+    summary.append("❌ CRITICAL ISSUES FOUND:")
     for issue in issues:
-        print(f"   • {issue}")
-    print()
-    print("Please fix these issues before running the automation.")
+        summary.append(f"   • {issue}")
+    summary.append("")
+    summary.append("Please fix these issues before running the automation.")
     
 if warnings:
-    print()
-    print("⚠️  WARNINGS:")
+    summary.append("")
+    summary.append("⚠️  WARNINGS:")
     for warning in warnings:
-        print(f"   • {warning}")
-    print()
-    print("These are not critical but should be reviewed.")
+        summary.append(f"   • {warning}")
+    summary.append("")
+    summary.append("These are not critical but should be reviewed.")
 
-print()
-print("═" * 80)
+summary.append("")
+summary.append(SEPARATOR)
+print("\n".join(summary))
 
 # Exit with error code if there are critical issues
 if issues:
@@ -3,11 +3,42 @@ Quick script to view the latest batch summary.
 """
 
 import os
+import shutil
+import sys
 from pathlib import Path
 
 LOGS_DIR = Path(__file__).parent / "logs"
 BATCH_SUMMARY_FILE = LOGS_DIR / "batch_summary.txt"
 
+def copy_to_stdout(f):
+    """
+    Copy an open binary file to stdout.
+    
+    Uses sendfile(2) so the kernel moves the bytes file-to-stdout without a
+    trip through Python; falls back to a buffered copy where that isn't
+    available (Windows, or stdout that isn't a real file descriptor).
+    
+    Args:
+        f: File opened in binary mode
+    """
+    size = os.fstat(f.fileno()).st_size
+    offset = 0
+    try:
+        out_fd = sys.stdout.fileno()
+        while offset < size:
+            sent = os.sendfile(out_fd, f.fileno(), offset, size - offset)
+            if sent == 0:  # File shrank while we were sending it
+                return
+            offset += sent
+        return
+    except (AttributeError, OSError):
+        pass
+    
+    # Carry on from wherever sendfile stopped
+    f.seek(offset)
+    shutil.copyfileobj(f, sys.stdout.buffer)
+    sys.stdout.buffer.flush()
+
 def view_summary():
     """Display the batch summary."""
     
@@ -17,11 +48,12 @@ def view_summary():
         print("\nRun batch_apply.py first to generate a summary.")
         return
     
-    # Read and display
-    with open(BATCH_SUMMARY_FILE, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    print(content)
+    # Display: hand the file's bytes straight to stdout instead of decoding
+    # them into one big string (flush first so earlier output stays in order)
+    sys.stdout.flush()
+    with open(BATCH_SUMMARY_FILE, 'rb') as f:
+        copy_to_stdout(f)
+    print()
     print("\n" + "="*80)
     print(f"Summary file: {BATCH_SUMMARY_FILE}")
     print("="*80)
@@ -1,5 +1,11 @@
 import requests
 import time
+from requests.adapters import HTTPAdapter
+
+# One keep-alive session for all attempts: later attempts reuse the first
+# one's TLS connection. No automatic retries - each attempt is timed on its own.
+session = requests.Session()
+session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=1))
 
 print("=" * 60)
 print("WAKING UP RESUME API")
@@ -12,19 +18,19 @@ print("")
 
 for i in range(3):
     print(f"Attempt {i+1}/3:")
-    start = time.time()
+    start = time.monotonic()
     try:
         payload = {
             "job_description": "Test job description to wake up API server",
             "return_format": "base64"
         }
         
-        r = requests.post(
+        r = session.post(
             'https://resume-optimizer-api-fvpd.onrender.com/api/v1/optimize',
             json=payload,
-            timeout=90
+            timeout=(5, 90)  # Connect within 5s; a cold start may take 90s to answer
         )
-        duration = time.time() - start
+        duration = time.monotonic() - start
         
         print(f"  Status: {r.status_code}, Response time: {duration:.1f}s")
         
@@ -43,6 +49,8 @@ for i in range(3):
         else:
             print(f"  ⚠️  Slow response ({duration:.1f}s) - Server was sleeping")
             
+    except requests.exceptions.ConnectTimeout:
+        print(f"  ❌ CONNECT TIMEOUT (>5s) - Server unreachable (check internet)")
     except requests.exceptions.Timeout:
         print(f"  ❌ TIMEOUT (>90s) - Server not responding")
     except Exception as e:
@@ -51,10 +59,14 @@ for i in range(3):
     print("")
     
     if i < 2:
-        print("  Waiting 3 seconds before next attempt...")
-        time.sleep(3)
+        # Back off a little more each time: 1s, then 1.5s
+        delay = min(1.5 ** i, 10)
+        print(f"  Waiting {delay:g} seconds before next attempt...")
+        time.sleep(delay)
         print("")
 
+session.close()
+
 print("=" * 60)
 print("RESULT: API is now awake and ready for batch processing")
 print("You should run the batch within the next 10-15 minutes")